@@ -1,5 +1,3 @@
-import random
-
 import numpy as np
 
 import algorithm_options
@@ -27,16 +25,12 @@ class Algorithm:
     def options(self):
         return []
 
-    def find_leader(self, population):
-        leader = population[0]
-        for unit in population:
-            if unit.cost < leader.cost:
-                leader = unit
-
-        return leader
+    def make_step(self, args, costs, best=None):
+        population = [Unit(arg, cost) for arg, cost in zip(args, costs)]
+        if best is None:
+            best = np.argmin(costs)
 
-    def get_better(self, a, b):
-        return a if a.cost < b.cost else b
+        return SimulationStep(population, best=population[best])
 
 
 class BlindSearch(Algorithm):
@@ -74,7 +68,7 @@ class ClimbingSearch(Algorithm):
         for i in range(options['iterations']):
             points = []
             for x in range(options['population']):
-                p = space.gen_unit_in_range(fn, lambda: center.arg + np.random.randn(2) * options['sigma'])
+                p = space.gen_unit_in_range(fn, lambda: center.arg + np.random.randn(space.dimension) * options['sigma'])
                 points.append(p)
                 if p.cost < extreme.cost:
                     extreme = p
@@ -100,7 +94,7 @@ class Anneling(Algorithm):
 
         T = options['initial_temp']
         while T > options['final_temp']:
-            x = space.gen_unit_in_range(fn, lambda: x0.arg + np.random.randn(2) * options['sigma'])
+            x = space.gen_unit_in_range(fn, lambda: x0.arg + np.random.randn(space.dimension) * options['sigma'])
 
             # take better solution
             if x.cost < x0.cost:
@@ -127,48 +121,61 @@ class Soma(Algorithm):
         }
 
     def run(self, space, fn, options):
-        points = [space.gen_uniform_sample() for _ in range(options['pop_size'])]
-        population = [Unit(arg=pos, cost=fn(pos)) for pos in points]
+        args = space.gen_uniform_samples(options['pop_size'])
+        costs = fn(args)
 
-        leader = self.find_leader(population, options['strategy'])
-        yield SimulationStep(population, best=leader)
+        leader = self.find_leader_index(costs, options['strategy'])
+        yield self.make_step(args, costs, best=leader)
 
         for i in range(options['migrations']):
-            new_population = []
-            for obj in population:
-                best_pos = None
-                best_value = np.inf
-                t = options['step_size']
+            targets = np.broadcast_to(args[leader], args.shape)
+            args, costs = self.migrate(space, fn, args, costs, targets, options, options['path_length'])
 
-                diff = leader.arg - obj.arg
+            leader = self.find_leader_index(costs, options['strategy'])
+            yield self.make_step(args, costs, best=leader)
 
-                while t < options['path_length']:
-                    x = np.random.uniform(0, 1, size=2) < options['prt']
-                    next_pos = obj.arg + diff * t * x
-                    if space.in_range(next_pos):
-                        z = fn(next_pos)
+    def migrate(self, space, fn, args, costs, targets, options, path_length):
+        """
+        move every unit towards its target, all positions on all paths are evaluated in one batch
+        and each unit is replaced by the best position found on its path
+        """
+        t = np.arange(options['step_size'], path_length, options['step_size'])
+        if not len(t):
+            return args, costs
 
-                        if z < best_value:
-                            best_value = z
-                            best_pos = next_pos
+        prt = np.random.uniform(0, 1, size=(len(args), len(t), args.shape[1])) < options['prt']
+        paths = args[:, np.newaxis] + (targets - args)[:, np.newaxis] * t[:, np.newaxis] * prt
 
-                    t += options['step_size']
+        valid = space.in_range(paths)
+        path_costs = np.full(valid.shape, np.inf)
+        if valid.any():
+            path_costs[valid] = fn(paths[valid])
 
-                new_population.append(Unit(arg=best_pos, cost=best_value))
-            population = new_population
+        units = np.arange(len(args))
+        best = np.argmin(path_costs, axis=1)
+        new_args = paths[units, best]
+        new_costs = path_costs[units, best]
 
-            leader = self.find_leader(population, options['strategy'])
-            yield SimulationStep(new_population, best=leader)
+        # units without any position in range on their path stay where they are
+        stuck = ~valid.any(axis=1)
+        new_args[stuck] = args[stuck]
+        new_costs[stuck] = costs[stuck]
 
-    def find_leader(self, population, strategy='AllToOne'):
+        return new_args, new_costs
+
+    def find_leader_index(self, costs, strategy='AllToOne'):
         if strategy == 'AllToOne':
-            return super(Soma, self).find_leader(population)
+            return np.argmin(costs)
 
-        return random.choice(population)
+        return np.random.randint(len(costs))
 
 
 
 class PSO(Algorithm):
+    TOPOLOGY_GBEST = 'gbest'
+    TOPOLOGY_RING = 'ring'
+    TOPOLOGY_VON_NEUMANN = 'von_neumann'
+
     def options(self):
         return {
             'migrations': algorithm_options.IntOption(default=100, min=2, max=100000),
@@ -179,38 +186,75 @@ class PSO(Algorithm):
 
             'c1': algorithm_options.FloatOption(default=1),
             'c2': algorithm_options.FloatOption(default=1),
+            'topology': algorithm_options.ChoiceOption([self.TOPOLOGY_GBEST, self.TOPOLOGY_RING, self.TOPOLOGY_VON_NEUMANN]),
         }
 
     def run(self, space, fn, options):
-        def make_unit(pos):
-            unit = Unit(arg=pos, cost=fn(pos))
-            unit.personal_best = unit
-            unit.speed = random.uniform(0, (abs(space.sizes[0][0]) + abs(space.sizes[0][1]))/20)
-            return unit
+        # whole swarm is kept in (pop_size, D) matrices
+        args = space.gen_uniform_samples(options['pop_size'])
+        costs = fn(args)
+        speed = np.random.uniform(0, (np.abs(space.lows) + np.abs(space.highs)) / 20, size=args.shape)
 
-        population = [make_unit(space.gen_uniform_sample()) for _ in range(options['pop_size'])]
-        gbest = self.find_leader(population)
-        yield SimulationStep(population, best=gbest)
+        pbest_args = args.copy()
+        pbest_costs = costs.copy()
+        neighbours = self.neighbours(len(args), options.get('topology', self.TOPOLOGY_GBEST))
+        yield self.make_pso_step(args, costs, pbest_args, pbest_costs)
 
         for iteration in range(options['migrations']):
-            new_population = []
-            for unit in population:
-                w = options['w_start'] - (options['w_start'] - options['w_end']) * iteration / options['migrations']
+            w = options['w_start'] - (options['w_start'] - options['w_end']) * iteration / options['migrations']
+
+            if neighbours is None:
+                leaders = np.full(len(args), np.argmin(pbest_costs))
+            else:
+                leaders = neighbours[np.arange(len(args)), np.argmin(pbest_costs[neighbours], axis=1)]
+
+            r1 = np.random.uniform(0, 1, size=args.shape)
+            r2 = np.random.uniform(0, 1, size=args.shape)
+            speed = w * speed + options['c1'] * r1 * (pbest_args - args) \
+                + options['c2'] * r2 * (pbest_args[leaders] - args)
 
-                new_speed = w * unit.speed + options['c1'] * random.uniform(0, 1) * (unit.personal_best.arg - unit.arg) \
-                    + options['c2'] * random.uniform(0, 1) * (gbest.arg - unit.arg)
-                new_pos = unit.arg + new_speed
+            args = space.cap(args + speed)
+            costs = fn(args)
 
-                new_unit = space.make_unit(
-                    new_pos, fn,
-                    speed=new_speed
-                )
-                new_unit.personal_best = self.get_better(unit.personal_best, new_unit)
-                gbest = self.get_better(gbest, new_unit)
-                new_population.append(new_unit)
+            improved = costs < pbest_costs
+            pbest_args[improved] = args[improved]
+            pbest_costs[improved] = costs[improved]
 
-            population = new_population
-            yield SimulationStep(population, best=gbest)
+            yield self.make_pso_step(args, costs, pbest_args, pbest_costs)
+
+    def neighbours(self, count, topology):
+        """
+        indices of neighbours (including particle itself) for each particle, None for global topology
+        """
+        particles = np.arange(count)
+        if topology == self.TOPOLOGY_GBEST:
+            return None
+        elif topology == self.TOPOLOGY_RING:
+            return np.stack([particles, (particles - 1) % count, (particles + 1) % count], axis=1)
+        elif topology == self.TOPOLOGY_VON_NEUMANN:
+            # particles are placed row by row into toroidal grid, the last row may be shorter
+            cols = int(np.ceil(np.sqrt(count)))
+            rows = -(-count // cols)
+            last = count - (rows - 1) * cols
+            r, c = np.divmod(particles, cols)
+
+            # rows and columns wrap separately, each within its own length
+            row_len = np.where(r == rows - 1, last, cols)
+            col_len = np.where(c < last, rows, rows - 1)
+            return np.stack([
+                particles,
+                r * cols + (c - 1) % row_len,
+                r * cols + (c + 1) % row_len,
+                (r - 1) % col_len * cols + c,
+                (r + 1) % col_len * cols + c
+            ], axis=1)
+
+        raise NotImplementedError("Unknown topology: " + topology)
+
+    def make_pso_step(self, args, costs, pbest_args, pbest_costs):
+        gbest = np.argmin(pbest_costs)
+        population = [Unit(arg, cost) for arg, cost in zip(args, costs)]
+        return SimulationStep(population, best=Unit(pbest_args[gbest].copy(), pbest_costs[gbest]))
 
 
 class DifferentialEvolution(Algorithm):
@@ -230,58 +274,59 @@ class DifferentialEvolution(Algorithm):
         }
 
     def run(self, space, fn, options):
-        def make_unit(pos):
-            unit = Unit(arg=pos, cost=fn(pos))
-            return unit
-
-        population = [make_unit(space.gen_uniform_sample()) for _ in range(options['np'])]
-        gbest = self.find_leader(population)
-        yield SimulationStep(population, best=gbest)
+        # population is kept as (NP, D) matrix with vector of costs
+        args = space.gen_uniform_samples(options['np'])
+        costs = fn(args)
+        yield self.make_step(args, costs)
 
         for generation in range(options['generations']):
-            new_population = []
-            for nth, unit in enumerate(population):
-                seq = list(range(len(population)))
-                seq.remove(nth)
-                random.shuffle(seq)
-
-                a = population[seq[0]]
-                b = population[seq[1]]
-                c = population[seq[2]]
-
-                if options['strategy'] == self.STRATEGY_1:
-                    noisy = c.arg + options['F'] * (a.arg - b.arg)
-                elif options['strategy'] == self.STRATEGY_2:
-                    # select all 100*p% percentile units and choose one of them
-                    pbests = self.find_p_bests(population, options['p'])
-                    pbest = random.choice(pbests)
-                    noisy = unit.arg + options['F'] * (pbest.arg - unit.arg) + options['F'] * (a.arg - b.arg)
-                else:
-                    raise NotImplementedError("Unknown strategy: " + options['strategy'])
-
-                new = np.zeros(len(a.arg))
-                irand = random.randint(0, len(a.arg) - 1)
-                for i in range(len(a.arg)):
-                    # ensure that at least one parameter is used from noisy
-                    if random.uniform(0, 1) < options['cr'] or i == irand:
-                        new[i] = noisy[i]
-                    else:
-                        new[i] = unit.arg[i]
-
-                candidate = space.make_unit(np.array(new), fn)
-                if candidate.cost <= unit.cost:
-                    new_population.append(candidate)
-                else:
-                    new_population.append(unit)
-
-            population = new_population
-            gbest = self.find_leader(population)
-            yield SimulationStep(population, best=gbest)
-
-    def find_p_bests(self, population, p):
-        costs = [unit.cost for unit in population]
+            a, b, c = self.pick_donors(len(args))
+
+            if options['strategy'] == self.STRATEGY_1:
+                noisy = args[c] + options['F'] * (args[a] - args[b])
+            elif options['strategy'] == self.STRATEGY_2:
+                # select all 100*p% percentile units and choose one of them for each unit
+                pbests = np.random.choice(self.find_p_bests(costs, options['p']), size=len(args))
+                noisy = args + options['F'] * (args[pbests] - args) + options['F'] * (args[a] - args[b])
+            else:
+                raise NotImplementedError("Unknown strategy: " + options['strategy'])
+
+            # ensure that at least one parameter is used from noisy
+            mask = np.random.uniform(0, 1, size=args.shape) < options['cr']
+            mask[np.arange(len(args)), np.random.randint(0, args.shape[1], size=len(args))] = True
+
+            candidates = space.cap(np.where(mask, noisy, args))
+            candidate_costs = fn(candidates)
+
+            improved = candidate_costs <= costs
+            args = np.where(improved[:, np.newaxis], candidates, args)
+            costs = np.where(improved, candidate_costs, costs)
+            yield self.make_step(args, costs)
+
+    def pick_donors(self, count):
+        """
+        choose three distinct donors for each unit, none of them is the unit itself,
+        populations smaller than four cannot have distinct donors and repeat them
+        """
+        units = np.arange(count)[:, np.newaxis]
+
+        def draw(rows):
+            # offsets in range of the other units, shifted over the unit itself
+            donors = np.random.randint(0, count - 1, size=(len(rows), 3))
+            return donors + (donors >= rows)
+
+        donors = draw(units)
+        while count >= 4:
+            clash = (donors[:, 0] == donors[:, 1]) | (donors[:, 0] == donors[:, 2]) | (donors[:, 1] == donors[:, 2])
+            if not clash.any():
+                break
+            donors[clash] = draw(units[clash])
+
+        return donors.T
+
+    def find_p_bests(self, costs, p):
         threshold = np.percentile(costs, 100 * (1-p))
-        return [unit for unit in population if unit.cost <= threshold]
+        return np.flatnonzero(costs <= threshold)
 
 
 class EvolutionalStrategy(Algorithm):
@@ -294,21 +339,13 @@ class EvolutionalStrategy(Algorithm):
         }
 
     def run(self, space, fn, options):
-        def make_unit(pos):
-            unit = Unit(arg=pos, cost=fn(pos))
-            return unit
-
         strategy = getattr(self, f'strategy_{options["strategy"]}')
-        population = [make_unit(space.gen_uniform_sample()) for _ in range(options['np'])]
+        population = space.make_units(space.gen_uniform_samples(options['np']), fn)
         dev = 1
 
         for i in range(options['generations']):
-            new_population = []
-            for parent in population:
-                new_pos = space.cap(parent.arg + np.random.normal(dev, size=len(parent.arg)))
-
-                child = Unit(arg=new_pos, cost=fn(new_pos))
-                new_population.append(child)
+            args = np.array([parent.arg for parent in population])
+            new_population = space.make_units(args + np.random.normal(dev, size=args.shape), fn)
 
             population, success = strategy(population, new_population)
 
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Run benchmark grid of configurations x functions x dimensions x samples in a process pool.
+Configuration is algorithm with its options and a label, one algorithm can be compared with several option sets:
+
+    experiments.py --configurations '[["DifferentialEvolution", {"F": 0.5}, "DE F=0.5"],
+                                      ["DifferentialEvolution", {"F": 0.9}, "DE F=0.9"]]'
+
+Results are written into CSV with one row per run, load them in notebooks with:
+
+    data = pd.read_csv('results.csv')
+    data.pivot_table(index='function', columns='label', values='best_cost')
+"""
+import argparse
+import csv
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer as timer
+
+import numpy as np
+
+import algorithm_options
+import utils
+from utils import Space, CountCallsProxy
+
+COLUMNS = ['label', 'algorithm', 'function', 'dimension', 'sample', 'seed', 'best_cost', 'evaluations', 'steps', 'time', 'options']
+
+
+def default_options(algo):
+    options = {}
+    for name, option in algo().options().items():
+        if isinstance(option, algorithm_options.ChoiceOption):
+            options[name] = option.choices[0]
+        elif isinstance(option, algorithm_options.StartPositionOption):
+            options[name] = None
+        else:
+            options[name] = option.default
+    return options
+
+
+def task_seeds(base_seed, samples):
+    """
+    independent reproducible seed for each sample, same samples share seed across algorithms
+    """
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(base_seed).spawn(samples)]
+
+
+def supports(fn, dimension):
+    """
+    whether test function is defined for points of given dimension
+    """
+    try:
+        fn(np.zeros((1, dimension)))
+    except NotImplementedError:
+        return False
+    return True
+
+
+def build_grid(configurations, functions, dimensions, samples, base_seed=0, bounds=(-6, 6)):
+    """
+    configurations are (algo, options) or (algo, options, label) tuples, the same algorithm can appear
+    with several option sets, options override defaults of the algorithm and label defaults to its name,
+    functions are skipped in dimensions they are not defined for
+    """
+    seeds = task_seeds(base_seed, samples)
+
+    for configuration in configurations:
+        algo, options = configuration[:2]
+        label = configuration[2] if len(configuration) > 2 else algo.__name__
+        algo_options = {**default_options(algo), **options}
+        for fn in functions:
+            for dimension in dimensions:
+                if not supports(fn, dimension):
+                    continue
+                for sample, seed in enumerate(seeds):
+                    yield label, algo, algo_options, fn, dimension, bounds, sample, seed
+
+
+def run_task(task):
+    label, algo, options, fn, dimension, bounds, sample, seed = task
+    random.seed(seed)
+    np.random.seed(seed)
+
+    space = Space(dimension * [list(bounds)])
+    cost_fn = CountCallsProxy(fn)
+
+    start = timer()
+    steps = 0
+    last = None
+    for last in algo().run(space, cost_fn, options):
+        steps += 1
+
+    return {
+        'label': label,
+        'algorithm': algo.__name__,
+        'function': fn.__name__,
+        'dimension': dimension,
+        'sample': sample,
+        'seed': seed,
+        'best_cost': last.best.cost,
+        'evaluations': cost_fn.called_count,
+        'steps': steps,
+        'time': timer() - start,
+        'options': json.dumps(options, sort_keys=True),
+    }
+
+
+def run_grid(tasks, output, workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        writer = csv.DictWriter(output, fieldnames=COLUMNS)
+        writer.writeheader()
+
+        for row in executor.map(run_task, tasks, chunksize=4):
+            writer.writerow(row)
+
+
+def main():
+    algos = {algo.__name__: algo for algo in utils.all_algorithms()}
+    functions = {fn.__name__: fn for fn in utils.all_functions()}
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--algorithms", nargs='+', default=list(algos.keys()), choices=algos.keys())
+    parser.add_argument("--functions", nargs='+', default=list(functions.keys()), choices=functions.keys())
+    parser.add_argument("--dimensions", nargs='+', type=int, default=[2])
+    parser.add_argument("--samples", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0, help="base seed from which seeds of all samples are derived")
+    parser.add_argument("--bounds", nargs=2, type=float, default=[-6, 6])
+    parser.add_argument("--options", type=json.loads, default={},
+                        help='JSON with options overrides, e.g. \'{"DifferentialEvolution": {"np": 20}}\'')
+    parser.add_argument("--configurations", type=json.loads, default=None,
+                        help='JSON list of [algorithm, options, label] used instead of --algorithms and --options')
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("-o", "--output", type=argparse.FileType('w'), default=sys.stdout)
+
+    args = parser.parse_args()
+
+    if args.configurations is not None:
+        configurations = [(algos[name], *rest) for name, *rest in args.configurations]
+    else:
+        configurations = [(algos[name], args.options.get(name, {})) for name in args.algorithms]
+
+    tasks = build_grid(
+        configurations,
+        [functions[name] for name in args.functions],
+        args.dimensions, args.samples, args.seed, tuple(args.bounds)
+    )
+
+    start = timer()
+    run_grid(tasks, args.output, args.workers)
+    print(f"finished in {timer() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
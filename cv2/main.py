@@ -1,4 +1,5 @@
 import sys
+from collections import OrderedDict
 
 from PyQt5.QtCore import pyqtSlot, QTimer
 from PyQt5.QtWidgets import QApplication, QMainWindow
@@ -11,6 +12,13 @@ from simulation import Simulation
 from utils import Space, MeasureContext
 from widgets import OptionWidget
 
+# number of steps kept for stepping back
+HISTORY = 5000
+# number of steps pulled from algorithm on each idle tick
+LOAD_CHUNK = 10
+# number of computed surfaces kept for switching back, meshes can have up to 2000 x 2000 points
+SURFACE_CACHE = 4
+
 
 class MainWindow(QMainWindow):
     def __init__(self, *args, **kwargs):
@@ -18,7 +26,11 @@ class MainWindow(QMainWindow):
         self.space = Space(2 * [[-6, 6]])
         self.renderers = []
         self.simulation = None
+        self.rendered = None
         self.algorithm_option_widgets = {}
+        # recently computed surfaces by (function, space, resolution), least recently used first
+        self.surfaces = OrderedDict()
+        self.surface_key = None
 
         self.ui = ui_main_window.Ui_MainWindow()
         self.ui.setupUi(self)
@@ -36,6 +48,10 @@ class MainWindow(QMainWindow):
         self.ui.functions.currentIndexChanged.connect(self.refresh)
         self.ui.algorithm.currentIndexChanged.connect(self.refresh)
         self.ui.startBtn.clicked.connect(self.refresh)
+        # typed resolution is applied only when finished, intermediate values would compute big meshes
+        self.ui.resolution.setKeyboardTracking(False)
+        self.ui.resolution.valueChanged.connect(self.update_fn)
+        self.ui.resolution.editingFinished.connect(self.update_fn)
         self.ui.finishBtn.clicked.connect(lambda: self.step_by(sys.maxsize))
         self.ui.stepBtn.clicked.connect(lambda: self.step_by(1))
         self.ui.stepBackBtn.clicked.connect(lambda: self.step_by(-1))
@@ -44,6 +60,10 @@ class MainWindow(QMainWindow):
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self.autoplay_next)
 
+        # pulls remaining steps of simulation in small chunks while GUI is idle
+        self.loader_timer = QTimer()
+        self.loader_timer.timeout.connect(self.load_next)
+
 
         self.setup_renderers()
         self.refresh()
@@ -93,13 +113,24 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot()
     def update_fn(self):
-        with self.measure("generate space"):
-            x = np.linspace(self.space.sizes[0][0], self.space.sizes[0][1], 50)
-            y = np.linspace(self.space.sizes[1][0], self.space.sizes[1][1], 50)
-            X, Y = np.meshgrid(x, y)
-
-            fn = self.ui.functions.currentData()
-            Z = fn(np.array([X, Y]))
+        fn = self.ui.functions.currentData()
+        resolution = self.ui.resolution.value()
+        key = (fn, tuple(map(tuple, self.space.sizes)), resolution)
+        if key == self.surface_key:
+            return
+        self.surface_key = key
+
+        if key not in self.surfaces:
+            with self.measure("generate space"):
+                x = np.linspace(self.space.sizes[0][0], self.space.sizes[0][1], resolution)
+                y = np.linspace(self.space.sizes[1][0], self.space.sizes[1][1], resolution)
+                X, Y = np.meshgrid(x, y)
+
+                self.surfaces[key] = x, y, fn(np.stack([X, Y], axis=-1))
+                if len(self.surfaces) > SURFACE_CACHE:
+                    self.surfaces.popitem(last=False)
+        self.surfaces.move_to_end(key)
+        x, y, Z = self.surfaces[key]
 
         for w in self.renderers:
             with self.measure(f"update_plane on {w.__class__.__name__}"):
@@ -112,15 +143,34 @@ class MainWindow(QMainWindow):
 
         options = self.algorithm_option_widgets[type(algo).__name__].get_options()
         options['min'] = self.ui.minMax.currentText() == 'min'
-        self.simulation = Simulation(self.space, algo, fn, options)
+        self.simulation = Simulation(self.space, algo, fn, options, history=HISTORY)
+        self.loader_timer.start(0)
+
+    def load_next(self):
+        # stops when finished or when history is full ahead of the current step, stepping restarts it
+        if not self.simulation.prefetch(LOAD_CHUNK):
+            self.loader_timer.stop()
+
+        self.update_step_label()
+
+    def update_step_label(self):
+        loading = "" if self.simulation.finished else " (loading...)"
+        self.ui.stepLabel.setText(f"{self.simulation.step}/{self.simulation.max_steps}{loading}")
 
     def step_by(self, count=1):
         self.simulation.step_by(count)
+        if not self.simulation.finished and not self.loader_timer.isActive():
+            self.loader_timer.start(0)
+
+        # renderers keep already uploaded steps unless simulation or its history window changed
+        rendered = (self.simulation, self.simulation.offset)
+        reset = rendered != self.rendered
+        self.rendered = rendered
 
         points = self.simulation.get_points()
         for w in self.renderers:
             with self.measure(f"update_points on {w.__class__.__name__}"):
-                w.update_points(points, self.ui.last_state.isChecked())
+                w.update_points(points, self.ui.last_state.isChecked(), reset)
 
         self.ui.result.setText("f({arg}) = {val:.4f}; cost fn called {called}x".format(
             arg=", ".join(["{:.4f}".format(i) for i in self.simulation.current_step().best.arg]),
@@ -128,8 +178,7 @@ class MainWindow(QMainWindow):
             called=self.simulation.current_step().cost_fn_called,
         ))
 
-        np_points = np.array(points)
-        self.ui.stepLabel.setText(f"{self.simulation.step}/{self.simulation.max_steps}")
+        self.update_step_label()
 
     def fill_z(self, groups, fn):
         for group in groups:
@@ -4,9 +4,20 @@ from PyQt5 import QtCore
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvas
 from matplotlib import cm
+from matplotlib.colors import hsv_to_rgb
 from mpl_toolkits.mplot3d import Axes3D
 from pyqtgraph.opengl.shaders import ShaderProgram, VertexShader, FragmentShader
-import colorsys
+
+POINT_COLORS = np.array([
+    (1, 0, 0, 1),
+    (0, 1, 0, 1),
+    (0, 0, 1, 1),
+    (1, 1, 0, 1),
+    (0, 1, 1, 1),
+    (1, 0, 1, 1),
+    (1, 1, 1, 1),
+    (0, 0, 0, 1),
+], dtype=float)
 
 
 class OpenglRenderer(gl.GLViewWidget):
@@ -29,6 +40,7 @@ class OpenglRenderer(gl.GLViewWidget):
         self.points.hide()
         self.points.setGLOptions('additive')
         self.addItem(self.points)
+        self.clear_points()
 
     def update_plane(self, X, Y, Z, space):
         delta = np.max(Z) - np.min(Z)
@@ -37,52 +49,72 @@ class OpenglRenderer(gl.GLViewWidget):
         else:
             self.scale = (1, 1, 1)
 
-        colors = []
-        for x, _ in enumerate(X):
-            for y, _ in enumerate(Y):
-                delta = np.max(Z)
-
-                val = 0 if delta == 0 else Z[x,y] / delta
-                (r, g, b) = colorsys.hsv_to_rgb(val, 1.0, 1.0)
-                colors.append((r, g, b, 1))
+        top = np.max(Z)
+        hue = np.zeros(Z.shape) if top == 0 else np.mod(Z / top, 1)
+        hsv = np.stack([hue, np.ones(Z.shape), np.ones(Z.shape)], axis=-1)
+        colors = np.ones((Z.size, 4))
+        colors[:, :3] = hsv_to_rgb(hsv).reshape(-1, 3)
 
         self.surface_plot.resetTransform()
         self.surface_plot.scale(*self.scale)
         self.surface_plot.rotate(90, 0, 0, 1)
         self.surface_plot.setData(X, Y, Z, colors=colors)
 
-    def update_points(self, points, last_only):
-        if len(points) <= 0:
+    def clear_points(self):
+        self.buffer_pos = np.empty((0, 3))
+        self.buffer_colors = np.empty((0, 4))
+        # end of each uploaded step in the buffer
+        self.step_ends = [0]
+
+    def update_points(self, points, last_only, reset=False):
+        """
+        points is (steps, pop, D + 1) array of history, rows of missing points are NaN.
+        Only steps not yet in the buffer are appended, stepping back truncates the buffer.
+        """
+        if reset:
+            self.clear_points()
+
+        shown = len(self.step_ends) - 1
+        if len(points) < shown:
+            del self.step_ends[len(points) + 1:]
+        elif len(points) > shown:
+            self.append_points(points[shown:], shown)
+
+        count = self.step_ends[-1]
+        if count <= 0:
             self.points.hide()
             return
 
         self.points.show()
-
-        if last_only:
-            points = points[-1:]
-
-        available_colors = [
-            (1, 0, 0, 1),
-            (0, 1, 0, 1),
-            (0, 0, 1, 1),
-            (1, 1, 0, 1),
-            (0, 1, 1, 1),
-            (1, 0, 1, 1),
-            (1, 1, 1, 1),
-            (0, 0, 0, 1),
-        ]
-        c = 0
-        all_points = []
-        colors = []
-        for point_group in points:
-            for point in point_group.points:
-                all_points.append(point.to_vec())
-                colors.append(available_colors[c])
-            c = (c + 1) % len(available_colors)
-
         self.points.resetTransform()
         self.points.scale(*self.scale)
-        self.points.setData(pos=np.array(all_points), color=np.array(colors))
+
+        if last_only:
+            self.points.setData(pos=self.buffer_pos[self.step_ends[-2]:count], color=POINT_COLORS[0])
+        else:
+            self.points.setData(pos=self.buffer_pos[:count], color=self.buffer_colors[:count])
+
+    def append_points(self, points, first_step):
+        count = self.step_ends[-1]
+
+        pos = points.reshape(-1, points.shape[-1])
+        groups = np.repeat(np.arange(first_step, first_step + len(points)), points.shape[1])
+        valid = ~np.isnan(pos[:, -1])
+        pos = pos[valid]
+        groups = groups[valid]
+
+        required = count + len(pos)
+        if required > len(self.buffer_pos) or pos.shape[1] != self.buffer_pos.shape[1]:
+            capacity = max(required, 2 * len(self.buffer_pos))
+            buffer_pos = np.empty((capacity, pos.shape[1]))
+            buffer_pos[:count] = self.buffer_pos[:count]
+            buffer_colors = np.empty((capacity, 4))
+            buffer_colors[:count] = self.buffer_colors[:count]
+            self.buffer_pos, self.buffer_colors = buffer_pos, buffer_colors
+
+        self.buffer_pos[count:required] = pos
+        self.buffer_colors[count:required] = POINT_COLORS[groups % len(POINT_COLORS)]
+        self.step_ends.extend(count + np.cumsum(np.bincount(groups - first_step, minlength=len(points))))
 
 
 class MatplotlibRenderer(FigureCanvas):
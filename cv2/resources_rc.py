@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\x0c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\xd3\x49\x44\x41\x54\x78\x01\xdd\x93\x85\x71\xc5\x30\
+\x0c\x40\x65\x08\x6c\x90\x59\xca\xbc\x5b\xb9\x47\xc5\x41\xca\x30\
+\x4d\x19\x0f\x83\x92\x1b\xc5\x85\xcf\xcc\x0a\xe8\x9d\xe1\x9d\x51\
+\x18\x63\xa0\x9b\x90\x36\x8d\x8a\xe0\xfa\xee\xe2\xe9\xea\xf6\xcc\
+\xf0\x77\x93\xb3\x2d\x3b\xfb\x2b\xe3\xfa\x86\x02\x63\x28\x58\x9a\
+\x5f\x85\xa5\xf9\x35\xa0\x9c\x6d\x19\x04\xb3\xd3\x0b\x30\x37\xb3\
+\x58\xd4\x37\x14\xa4\x69\x5a\xe4\xe7\x97\x87\x3f\xb6\x59\xc0\xe7\
+\xd7\x87\xe5\x46\x82\x38\x8e\x01\x89\x20\x4a\x22\xe6\xbf\x32\x21\
+\x04\x78\xae\xc7\xdc\x4c\x90\x00\x62\x06\x51\x1c\x31\xff\x95\x49\
+\x21\xc0\x75\x3d\xe6\x16\x46\x80\x08\x5a\xeb\xb2\x11\x48\x29\xc1\
+\xf3\xfc\x9a\x23\xd0\x95\x02\x0e\x3b\xdc\x52\x81\x62\x49\xc3\x29\
+\x54\xcc\xd7\xaf\x1a\x01\x11\x35\x1f\x01\x66\xe9\xf3\xf1\xc9\x41\
+\xc0\xac\x94\x7e\xe6\x4c\x88\xcf\x3b\x7b\x1b\x45\x99\xe6\xb2\x8a\
+\x98\x88\xbb\xd0\x65\x7c\x03\x1b\x59\x98\xbd\x87\x74\x5f\x4d\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x3d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\xf2\x49\x44\x41\x54\x48\x89\xdd\xd5\x31\x8a\
+\x83\x50\x10\x80\xe1\x61\x2d\x44\x50\xc1\x4b\xa9\x95\x5a\x58\xe8\
+\x91\xc4\x6b\xe8\x0d\xac\xec\x7c\x85\x95\x77\xb0\xd0\x3b\x88\x22\
+\xfc\x69\xa2\x24\x81\x14\x9b\x7d\x81\x4d\xa6\xf7\xff\x06\x84\x79\
+\x22\x5f\x39\x80\xe2\x7e\x3a\xdd\x00\xe3\x38\x52\xd7\x35\xd3\x34\
+\xe9\x47\x00\xd2\x34\x45\x44\x70\x1c\x07\xa5\x94\x5e\x04\xa0\x28\
+\x0a\x44\x04\x11\xc1\xb6\x6d\xba\xae\xd3\x87\x00\x6a\x5d\x57\xa2\
+\x28\x7a\x2f\xb2\xef\x3b\x79\x9e\x9f\x88\x65\x59\xb4\x6d\xab\x1f\
+\xc9\xb2\xec\x44\x4c\xd3\xa4\x69\x1a\xbd\xc8\xb6\x6d\x24\x49\xf2\
+\x05\xc8\xb2\x2c\xf8\xbe\x7f\xf7\xe3\xfb\xbe\x07\xe0\xd9\x77\x3f\
+\xbf\x41\x0c\xc3\x10\xdb\xb6\x6f\x51\x59\xd7\xf5\xe5\xa5\x6f\x43\
+\x6a\x59\x16\xc2\x30\x3c\xb7\x77\x5d\xf7\xdc\x1e\x50\xff\x3b\x1e\
+\x04\xc1\x19\xf7\x3c\x8f\x61\x18\x3e\x20\xbe\x6d\x1b\x71\x1c\x3f\
+\x3b\x15\xaf\xc7\xaf\x00\x65\x59\xbe\x27\x7e\x00\xc7\x0d\x7a\x38\
+\xd7\x7f\x8f\x1f\xc0\x38\x8e\x54\x55\xc5\x3c\xcf\x7a\xe3\x57\xe0\
+\xf1\xc9\xd4\x17\xff\xb8\xb9\x00\x19\xf5\xa9\x18\xd9\x4c\x84\xf0\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x2f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\xe4\x49\x44\x41\x54\x48\x89\xe5\x95\x3b\x0a\
+\x84\x30\x14\x45\x1f\x63\x61\xe1\x67\x5b\x5a\x89\x76\xc6\x3d\xe9\
+\x2e\xec\x2c\x5d\x80\x11\x74\x1b\x16\x36\xee\x40\x14\xe1\x4e\xa3\
+\x4e\xb4\x18\x18\xf2\x02\xc3\xcc\xed\x42\xe0\x1c\x92\x17\x6e\x88\
+\xfe\x3a\x00\x5a\xbc\x22\xd9\xc1\xd3\x34\xa1\xaa\x2a\x0c\xc3\x00\
+\x00\x60\x85\x4b\x29\xe1\x79\x1e\x88\x08\x42\x08\x1e\x81\x0a\x77\
+\x1c\x07\x44\x04\x22\x42\x51\x14\xfa\x82\x03\xde\x34\xcd\x05\x1e\
+\x45\x11\xd6\x75\x05\x80\x56\x1b\x5e\xd7\x35\x6c\xdb\x3e\xe1\x42\
+\x08\x6c\xdb\x66\x06\x9e\xa6\xa9\x39\x78\x92\x24\xe6\xae\x25\x8e\
+\x63\x7d\xf8\x2e\x40\xd7\x75\x97\x81\x06\x41\x80\x79\x9e\x3f\x82\
+\x3f\xde\x6d\x2e\xcb\x72\x59\xbb\xae\x4b\x96\x65\xd1\x2e\xd4\xcb\
+\x71\x45\x7d\xdf\xc3\xf7\xfd\xf3\x14\x61\x18\x1e\xa7\xd0\xaf\x86\
+\xdf\x97\x28\x43\xe7\x93\xdc\xab\x42\x79\xb6\x7c\x92\x7b\xd9\xe5\
+\x79\x6e\xb6\xae\xb3\x2c\xe3\x13\xa8\x92\x71\x1c\x51\x96\x25\xef\
+\x87\x73\x97\x28\xd1\xab\x8e\xaf\xcd\x13\x67\x69\xa3\x0f\xf4\xaa\
+\x3c\x68\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x71\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x01\x38\x49\x44\x41\x54\x78\x01\xc5\x53\x43\x82\x1c\x50\
+\x14\x4c\x76\xbd\xca\x3d\x72\x89\xdc\x21\x37\xe8\x59\x8f\x6d\xdb\
+\xb6\x6d\x9b\x6d\xdb\xb6\x6d\xe3\x8d\x67\x35\xe6\xe7\xaa\x9e\xaa\
+\xea\x17\x00\x7c\xe8\x7e\x6e\x80\x33\xd4\x11\xfd\xf4\xfc\xa8\x0e\
+\x85\x42\x21\xde\x15\xe0\xe4\xfc\x00\xb4\x3a\x75\x14\x85\x3d\xb5\
+\x9e\x9c\x1f\xfe\x7f\x57\x80\x78\x3c\x0e\xa1\x50\x10\x84\x62\x5e\
+\xf8\xaa\x22\xe2\xe9\xe9\xde\xdf\x57\x07\xd8\xd9\xdf\x80\x48\x24\
+\x0c\x06\xa3\x16\xec\x0e\x2b\xb8\xdc\xce\x24\x8e\x80\x0e\xef\x1d\
+\x6e\xf5\x1f\x1c\x1c\xfc\x79\x31\xc0\xe2\xca\xec\x4d\x76\xb9\x4a\
+\x02\x7c\x31\x07\x64\x57\xbf\xdb\xe3\x02\xa3\xc9\x10\xdf\xd9\xdf\
+\xf2\x2c\xac\xce\xa6\x00\xc0\xef\x27\x03\x8c\x4d\x0e\x81\x3f\xe0\
+\xbb\x01\x8b\xe5\x02\x50\x69\xe5\x60\x34\xeb\xc1\xe7\xf7\x42\x2c\
+\x16\x85\xd5\xf5\x45\x18\x9b\x1a\xfa\xf7\x64\x80\xee\xbe\x76\xf0\
+\xfa\x3c\x0f\x60\xb3\xd5\x78\x13\xd0\x60\xd4\xc7\xa7\xe7\x26\xbc\
+\xdd\xbd\x1d\xcf\x57\xd0\xd8\x5c\x7b\x93\x4d\xad\x53\x80\xc7\xeb\
+\x02\x87\xd3\x91\x5c\x58\x9a\x09\xb7\x75\x34\xf7\x57\xf5\x54\xbd\
+\x3c\x83\xb2\x8a\x22\x88\x46\xa3\x57\x60\x37\xec\xef\xef\x84\x6b\
+\xeb\xab\x88\x65\x65\x05\xaf\x67\x21\x3b\x37\x1d\x28\x54\x72\xb4\
+\xb4\xbc\xc8\x9a\x9d\x97\xf1\x76\x1d\xe4\xe6\x65\xd0\xb3\x72\xd2\
+\xea\x90\x48\x24\xe2\x67\xbc\xf0\x23\x01\x2e\x01\xbf\x81\x04\xc3\
+\x1c\xd8\xf6\xc2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x18\
+\x0b\xa7\x9e\x07\
+\x00\x6d\
+\x00\x65\x00\x64\x00\x69\x00\x61\x00\x2d\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x62\x00\x61\x00\x63\x00\x6b\x00\x2d\x00\x70\x00\x61\
+\x00\x75\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0c\x2b\x1f\xc7\
+\x00\x67\
+\x00\x6f\x00\x2d\x00\x6e\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x0e\x36\x76\xc7\
+\x00\x67\
+\x00\x6f\x00\x2d\x00\x70\x00\x72\x00\x65\x00\x76\x00\x69\x00\x6f\x00\x75\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x18\
+\x0f\xa4\x86\x47\
+\x00\x6d\
+\x00\x65\x00\x64\x00\x69\x00\x61\x00\x2d\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x62\x00\x61\x00\x63\x00\x6b\x00\x2d\x00\x73\x00\x74\
+\x00\x61\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x01\x10\
+\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x02\x51\
+\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\x03\x84\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x67\x9a\x0a\x66\x00\
+\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x01\x10\
+\x00\x00\x01\x67\x9a\x0a\x66\x00\
+\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x02\x51\
+\x00\x00\x01\x67\x9a\x0a\x66\x00\
+\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\x03\x84\
+\x00\x00\x01\x67\x9a\x0a\x66\x00\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -1,41 +1,177 @@
+import numpy as np
+
 import utils
+from algorithms import SimulationStep, Unit
+
+
+class History:
+    """
+    Points of steps stored in preallocated contiguous arrays.
+    Each row is [*arg, cost], so the arrays can be sliced and rendered directly,
+    Unit and SimulationStep objects are created only on demand.
+    """
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.count = 0
+        # number of steps dropped from the beginning when capacity was reached
+        self.offset = 0
+
+        self.points = None  # (steps, pop, D + 1)
+        self.sizes = None   # (steps,) number of valid points in each step
+        self.best = None    # (steps, D + 1)
+        self.called = None  # (steps,) number of cost fn calls
+
+    def __len__(self):
+        return self.count
+
+    def append(self, points, best, called):
+        if self.points is None:
+            self.allocate(min(16, self.capacity) if self.capacity else 16, len(points), points.shape[1])
+        elif self.count == len(self.points):
+            self.grow()
+
+        if len(points) > self.points.shape[1]:
+            self.widen(len(points))
+
+        self.points[self.count, :len(points)] = points
+        self.points[self.count, len(points):] = np.nan
+        self.sizes[self.count] = len(points)
+        self.best[self.count] = best
+        self.called[self.count] = called
+        self.count += 1
+
+    def allocate(self, steps, pop, width):
+        self.points = np.empty((steps, pop, width))
+        self.sizes = np.empty(steps, dtype=int)
+        self.best = np.empty((steps, width))
+        self.called = np.empty(steps, dtype=int)
+
+    def grow(self):
+        if self.capacity and self.count >= self.capacity:
+            # drop the older half, so dropping is amortized O(1) per step
+            keep = self.capacity // 2
+            drop = self.count - keep
+            for arr in (self.points, self.sizes, self.best, self.called):
+                arr[:keep] = arr[drop:self.count]
+            self.offset += drop
+            self.count = keep
+            return
+
+        steps = 2 * len(self.points)
+        if self.capacity:
+            steps = min(steps, self.capacity)
+        self.resize(steps, self.points.shape[1])
+
+    def widen(self, pop):
+        self.resize(len(self.points), pop)
+
+    def resize(self, steps, pop):
+        old = self.points, self.sizes, self.best, self.called
+        self.allocate(steps, pop, old[0].shape[2])
+        self.points[:] = np.nan
+        self.points[:self.count, :old[0].shape[1]] = old[0][:self.count]
+        self.sizes[:self.count] = old[1][:self.count]
+        self.best[:self.count] = old[2][:self.count]
+        self.called[:self.count] = old[3][:self.count]
+
+    def window(self, start, end):
+        """
+        (steps, pop, D + 1) view of points, rows of missing points are filled with NaN
+        """
+        return self.points[start:end]
+
+    def step(self, i):
+        points = self.points[i, :self.sizes[i]]
+        step = SimulationStep(
+            [Unit(row[:-1], row[-1]) for row in points],
+            best=Unit(self.best[i, :-1], self.best[i, -1])
+        )
+        step.cost_fn_called = self.called[i]
+        return step
 
 
 class Simulation:
-    def __init__(self, space, algo, fn, options):
+    """
+    Steps are pulled from the algorithm lazily, only last `history` steps are kept for stepping back
+    """
+
+    def __init__(self, space, algo, fn, options, history=None):
         self.step = 1
         self.algo = algo
         self.fn = fn
         self.options = options
         self.space = space
 
-        cost_fn = utils.CountCallsProxy((lambda X: -fn(X)) if not options['min'] else fn)
+        self.cost_fn = utils.CountCallsProxy((lambda X: -fn(X)) if not options['min'] else fn)
+        self.generator = algo.run(self.space, self.cost_fn, options)
+        self.finished = False
+
+        self.history = History(history)
 
-        self.steps = []
-        for step in algo.run(self.space, cost_fn, options):
-            step.cost_fn_called = cost_fn.called_count
+        self.fetch(self.step + 1)
 
-            def fix(unit):
-                unit.cost *= -1
-                return unit
+    def fetch(self, count=1):
+        """
+        pull up to count steps from the algorithm, returns number of fetched steps
+        """
+        fetched = 0
+        while fetched < count and not self.finished:
+            try:
+                step = next(self.generator)
+            except StopIteration:
+                self.finished = True
+                break
 
-            if not options['min']:
-                step.points = [fix(p) for p in step.points]
+            points = np.array([p.to_vec() for p in step.points])
+            best = step.best.to_vec()
+            if not self.options['min']:
+                points[:, -1] *= -1
+                best[-1] *= -1
 
-            self.steps.append(step)
+            self.history.append(points, best, self.cost_fn.called_count)
+            fetched += 1
+
+        return fetched
+
+    def prefetch(self, count):
+        """
+        fetch up to count steps ahead of the current step, never so many that the current step
+        would be dropped from bounded history, returns number of fetched steps
+        """
+        if self.history.capacity:
+            # history keeps capacity // 2 newest steps when it drops the older half
+            count = min(count, self.history.capacity // 2 - (self.loaded - self.step))
+        return self.fetch(count) if count > 0 else 0
+
+    @property
+    def offset(self):
+        return self.history.offset
+
+    @property
+    def loaded(self):
+        return self.offset + len(self.history)
 
     @property
     def max_steps(self):
-        return len(self.steps) - 1
+        return self.loaded - 1
+
+    @property
+    def min_step(self):
+        # earliest kept step still needs one prior step to draw
+        return max(1, self.offset + 1)
 
     def is_end(self):
-        return self.step >= self.max_steps
+        return self.finished and self.step >= self.max_steps
 
     def set_step(self, n):
-        self.step = n
+        self.step = max(self.min_step, min(self.max_steps, n))
 
     def step_by(self, n):
-        self.step = max(1, min(self.max_steps, self.step + n))
+        if self.step + n > self.max_steps:
+            self.fetch(self.step + n - self.max_steps)
+
+        self.set_step(self.step + n)
 
     def step_forward(self):
         self.step_by(1)
@@ -44,7 +180,7 @@ class Simulation:
         self.step_by(-1)
 
     def current_step(self):
-        return self.steps[self.step]
+        return self.history.step(self.step - self.offset)
 
     def get_points(self):
-        return self.steps[0:self.step]
\ No newline at end of file
+        return self.history.window(0, self.step - self.offset)
@@ -1,98 +1,58 @@
-import random
-
 import numpy as np
 
-import algorithm_options
 import algorithms
-from algorithms import Algorithm, SimulationStep, Unit
+
+# elements of the distance block computed at once in find_further, bounds memory of big populations
+DISTANCE_BLOCK = 2**22
 
 
 class SomaDynamicPathLength(algorithms.Soma):
     def run(self, space, fn, options):
-        points = [space.gen_uniform_sample() for _ in range(options['pop_size'])]
-        population = [Unit(arg=pos, cost=fn(pos)) for pos in points]
+        args = space.gen_uniform_samples(options['pop_size'])
+        costs = fn(args)
 
-        leader = self.find_leader(population)
-        yield SimulationStep(population, best=leader)
+        leader = self.find_leader_index(costs)
+        yield self.make_step(args, costs, best=leader)
 
         for i in range(options['migrations']):
-            new_population = []
-            for obj in population:
-                best_pos = None
-                best_value = np.inf
-                t = options['step_size']
-
-                diff = leader.arg - obj.arg
-
-                # slower steps at begin
-                while t < options['path_length'] * i**3 / options['migrations']**3 + options['step_size'] + 0.1:
-                    x = np.random.uniform(0, 1, size=2) < options['prt']
-                    next_pos = obj.arg + diff * t * x
-                    if space.in_range(next_pos):
-                        z = fn(next_pos)
-
-                        if z < best_value:
-                            best_value = z
-                            best_pos = next_pos
+            targets = np.broadcast_to(args[leader], args.shape)
 
-                    t += options['step_size']
+            # slower steps at begin
+            path_length = options['path_length'] * i**3 / options['migrations']**3 + options['step_size'] + 0.1
+            args, costs = self.migrate(space, fn, args, costs, targets, options, path_length)
 
-                new_population.append(Unit(arg=best_pos, cost=best_value))
-            population = new_population
-
-            leader = self.find_leader(population)
-            yield SimulationStep(new_population, best=leader)
+            leader = self.find_leader_index(costs)
+            yield self.make_step(args, costs, best=leader)
 
 
 class SomaFurthest(algorithms.Soma):
     def run(self, space, fn, options):
-        points = [space.gen_uniform_sample() for _ in range(options['pop_size'])]
-        population = [Unit(arg=pos, cost=fn(pos)) for pos in points]
+        args = space.gen_uniform_samples(options['pop_size'])
+        costs = fn(args)
 
-        leader = self.find_leader(population)
-        yield SimulationStep(population, best=leader)
+        leader = self.find_leader_index(costs)
+        yield self.make_step(args, costs, best=leader)
 
         for i in range(options['migrations']):
-            new_population = []
-            for obj in population:
-                best_pos = None
-                best_value = np.inf
-                t = options['step_size']
-
-                # choose leader or furthest point
-                if np.random.uniform(0, 1) < 0.1:
-                    diff = leader.arg - obj.arg
-                else:
-                    diff = self.find_further(population, obj).arg - obj.arg
-
-                while t < options['path_length']:
-                    x = np.random.uniform(0, 1, size=2) < options['prt']
-                    next_pos = obj.arg + diff * t * x
-
-                    if space.in_range(next_pos):
-                        z = fn(next_pos)
-
-                        if z < best_value:
-                            best_value = z
-                            best_pos = next_pos
-
-                    t += options['step_size']
-
-                new_population.append(Unit(arg=best_pos, cost=best_value))
-            population = new_population
-
-            leader = self.find_leader(population)
-            yield SimulationStep(new_population, best=leader)
-
-    def find_further(self, population, current):
-        far = current
-        max_dist = 0
-
-        for unit in population:
-            dist = np.linalg.norm(current.arg - unit.arg)
-            if dist > max_dist:
-                max_dist = dist
-                far = unit
-
-        return far
-
+            # choose leader or furthest point
+            to_leader = np.random.uniform(0, 1, size=len(args)) < 0.1
+            targets = np.where(to_leader[:, np.newaxis], args[leader], args[self.find_further(args)])
+
+            args, costs = self.migrate(space, fn, args, costs, targets, options, options['path_length'])
+
+            leader = self.find_leader_index(costs)
+            yield self.make_step(args, costs, best=leader)
+
+    def find_further(self, args):
+        """
+        index of the furthest unit for each unit
+        """
+        # |a - b|^2 = |a|^2 + |b|^2 - 2ab, |a|^2 is the same for the whole row and does not change argmax
+        norms = np.add.reduce(args * args, axis=1)
+        rows = max(1, DISTANCE_BLOCK // len(args))
+
+        further = np.empty(len(args), dtype=int)
+        for start in range(0, len(args), rows):
+            block = norms[np.newaxis] - 2 * args[start:start + rows] @ args.T
+            further[start:start + rows] = np.argmax(block, axis=1)
+        return further
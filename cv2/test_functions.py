@@ -1,20 +1,31 @@
 import numpy as np
 
+# Every function evaluates along the last axis, so it accepts a single
+# point of shape (D,) as well as a batch of shape (N, D) (or a mesh of
+# shape (..., D)) and returns one cost per point.
+
+def _split_2d(X):
+    if X.shape[-1] != 2:
+        raise NotImplementedError
+
+    return X[..., 0], X[..., 1]
+
+
 def shekel(X):
-    return 1.0 / (np.add.reduce((X -3) * X))
+    return 1.0 / (np.add.reduce((X -3) * X, axis=-1))
 
 
 def rastrigin(X, A=10):
-    n = len(X)
-    return A*n + np.add.reduce(X*X - A*np.cos(2 * np.pi * X))
+    n = X.shape[-1]
+    return A*n + np.add.reduce(X*X - A*np.cos(2 * np.pi * X), axis=-1)
 
 def ackley(X):
-    return -20 * np.exp(-0.2 * np.sqrt(0.5 * (np.add.reduce(X ** 2)))) \
-           - np.exp(0.5 * (np.add.reduce(np.cos(2 * np.pi * X)))) \
+    return -20 * np.exp(-0.2 * np.sqrt(0.5 * (np.add.reduce(X ** 2, axis=-1)))) \
+           - np.exp(0.5 * (np.add.reduce(np.cos(2 * np.pi * X), axis=-1))) \
            + np.e + 20
 
 def sphere(X):
-    return np.add.reduce(X*X)
+    return np.add.reduce(X*X, axis=-1)
 
 
 #def rosenbrock(X):
@@ -25,32 +36,21 @@ def sphere(X):
 #    return np.add.reduce(100*(X1 - X*X) + (1 - X)**2)
 
 def bukin_n6(X):
-    if len(X) != 2:
-        raise NotImplementedError
-
-    x = X[0]
-    y = X[1]
+    x, y = _split_2d(X)
 
     return 100*np.sqrt(np.abs(y - 0.01*x**2))+0.01*np.abs(x + 10)
 
 
 
 def beale(X):
-    if len(X) != 2:
-        raise NotImplementedError
+    x, y = _split_2d(X)
 
-    x = X[0]
-    y = X[1]
     return (1.5 - x + x*y)**2 \
         + (2.25 - x + x*y**2)**2 \
         + (2.625 - x + x*y**3)**2
 
 def goldstein_price(X):
-    if len(X) != 2:
-        raise NotImplementedError
-
-    x = X[0]
-    y = X[1]
+    x, y = _split_2d(X)
 
     return (1 + \
            (x + y + 1)**2 * (19 - 14*x + 3*x**2 - 14*y + 6*x*y + 3*y*y)) * \
@@ -58,36 +58,30 @@ def goldstein_price(X):
 
 
 def holder_table(X):
-    if len(X) != 2:
-        raise NotImplementedError
-
-    x = X[0]
-    y = X[1]
+    x, y = _split_2d(X)
 
     return -np.abs(np.sin(x) * np.cos(y) * np.exp(np.abs(1 - np.sqrt(x**2 + y**2)/np.pi))) + 4
 
 
 def styblinski_tang(X):
-    return np.add.reduce(X**4 - 16 * X**2 + 5*X)/2
+    return np.add.reduce(X**4 - 16 * X**2 + 5*X, axis=-1)/2
 
 def griewank(X):
-    prod = 1
-
-    for i in range(len(X)):
-        prod *= np.cos(X[i] / np.sqrt(i+1))
+    i = np.arange(1, X.shape[-1] + 1)
+    prod = np.multiply.reduce(np.cos(X / np.sqrt(i)), axis=-1)
 
-    return 1 + np.add.reduce(X**2/4000) - prod
+    return 1 + np.add.reduce(X**2/4000, axis=-1) - prod
 
 
 def schwefel_2_20(X):
-    return np.add.reduce(np.abs(X))
+    return np.add.reduce(np.abs(X), axis=-1)
 
 def schwefel_2_23(X):
-    return np.add.reduce(X**10)
+    return np.add.reduce(X**10, axis=-1)
 
 def plane(X):
-    return np.add.reduce(X*0)
+    return np.add.reduce(X*0, axis=-1)
 
 
 def trychtyr(X):
-    return -20 * np.exp(-0.2 * np.sqrt(0.5 * (np.add.reduce(X ** 2))))
\ No newline at end of file
+    return -20 * np.exp(-0.2 * np.sqrt(0.5 * (np.add.reduce(X ** 2, axis=-1))))
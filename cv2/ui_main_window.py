@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(745, 513)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.functions = QtWidgets.QComboBox(self.centralwidget)
+        self.functions.setObjectName("functions")
+        self.horizontalLayout_2.addWidget(self.functions)
+        self.algorithm = QtWidgets.QComboBox(self.centralwidget)
+        self.algorithm.setObjectName("algorithm")
+        self.horizontalLayout_2.addWidget(self.algorithm)
+        self.minMax = QtWidgets.QComboBox(self.centralwidget)
+        self.minMax.setObjectName("minMax")
+        self.minMax.addItem("")
+        self.minMax.addItem("")
+        self.horizontalLayout_2.addWidget(self.minMax)
+        self.resolution = QtWidgets.QSpinBox(self.centralwidget)
+        self.resolution.setMinimum(2)
+        self.resolution.setMaximum(2000)
+        self.resolution.setSingleStep(50)
+        self.resolution.setProperty("value", 50)
+        self.resolution.setObjectName("resolution")
+        self.horizontalLayout_2.addWidget(self.resolution)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.last_state = QtWidgets.QCheckBox(self.centralwidget)
+        self.last_state.setChecked(True)
+        self.last_state.setObjectName("last_state")
+        self.horizontalLayout_2.addWidget(self.last_state)
+        self.autoplay = QtWidgets.QPushButton(self.centralwidget)
+        self.autoplay.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/icons/media-playback-start.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon.addPixmap(QtGui.QPixmap(":/icons/icons/media-playback-pause.png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        self.autoplay.setIcon(icon)
+        self.autoplay.setCheckable(True)
+        self.autoplay.setObjectName("autoplay")
+        self.horizontalLayout_2.addWidget(self.autoplay)
+        self.startBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.startBtn.setObjectName("startBtn")
+        self.horizontalLayout_2.addWidget(self.startBtn)
+        self.stepBackBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.stepBackBtn.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/icons/go-previous.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.stepBackBtn.setIcon(icon1)
+        self.stepBackBtn.setObjectName("stepBackBtn")
+        self.horizontalLayout_2.addWidget(self.stepBackBtn)
+        self.stepLabel = QtWidgets.QLabel(self.centralwidget)
+        self.stepLabel.setMinimumSize(QtCore.QSize(45, 0))
+        self.stepLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.stepLabel.setObjectName("stepLabel")
+        self.horizontalLayout_2.addWidget(self.stepLabel)
+        self.stepBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.stepBtn.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/icons/go-next.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.stepBtn.setIcon(icon2)
+        self.stepBtn.setObjectName("stepBtn")
+        self.horizontalLayout_2.addWidget(self.stepBtn)
+        self.finishBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.finishBtn.setObjectName("finishBtn")
+        self.horizontalLayout_2.addWidget(self.finishBtn)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.verticalLayout.addLayout(self.horizontalLayout_6)
+        self.result = QtWidgets.QLabel(self.centralwidget)
+        self.result.setText("")
+        self.result.setObjectName("result")
+        self.verticalLayout.addWidget(self.result)
+        self.algorithmOptions = QtWidgets.QVBoxLayout()
+        self.algorithmOptions.setObjectName("algorithmOptions")
+        self.verticalLayout.addLayout(self.algorithmOptions)
+        self.tabWidget = QtWidgets.QTabWidget(self.centralwidget)
+        self.tabWidget.setObjectName("tabWidget")
+        self.tab = QtWidgets.QWidget()
+        self.tab.setObjectName("tab")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.tab)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.verticalLayout_3.addLayout(self.verticalLayout_2)
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QtWidgets.QWidget()
+        self.tab_2.setObjectName("tab_2")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.tab_2)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.horizontalLayout.addLayout(self.verticalLayout_4)
+        self.tabWidget.addTab(self.tab_2, "")
+        self.tab_3 = QtWidgets.QWidget()
+        self.tab_3.setObjectName("tab_3")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.tab_3)
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.verticalLayout_6.addLayout(self.verticalLayout_5)
+        self.tabWidget.addTab(self.tab_3, "")
+        self.verticalLayout.addWidget(self.tabWidget)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        self.tabWidget.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.minMax.setItemText(0, _translate("MainWindow", "min"))
+        self.minMax.setItemText(1, _translate("MainWindow", "max"))
+        self.resolution.setToolTip(_translate("MainWindow", "surface mesh resolution"))
+        self.last_state.setText(_translate("MainWindow", "last state"))
+        self.startBtn.setText(_translate("MainWindow", "Start"))
+        self.stepLabel.setText(_translate("MainWindow", "0/0"))
+        self.finishBtn.setText(_translate("MainWindow", "Finish"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("MainWindow", "3D view"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("MainWindow", "Matplotlib"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), _translate("MainWindow", "Console"))
+import resources_rc
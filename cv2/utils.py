@@ -12,6 +12,12 @@ import algorithms
 class Space:
     def __init__(self, sizes):
         self.sizes = sizes
+        self.lows = np.array([s[0] for s in sizes], dtype=float)
+        self.highs = np.array([s[1] for s in sizes], dtype=float)
+
+    @property
+    def dimension(self):
+        return len(self.sizes)
 
     def gen_uniform_unit(self, fn):
         p = self.gen_uniform_sample()
@@ -24,24 +30,29 @@ class Space:
     def gen_uniform_sample(self):
         return np.array([random.uniform(s[0], s[1]) for s in self.sizes])
 
-    def in_range(self, p):
-        for value, constraint in zip(p, self.sizes):
-            if value < constraint[0] or value > constraint[1]:
-                return False
+    def gen_uniform_samples(self, count):
+        """
+        generate (count, D) matrix of uniformly distributed points
+        """
+        return np.random.uniform(self.lows, self.highs, size=(count, self.dimension))
 
-        return True
+    def in_range(self, p):
+        """
+        check single point (D,) or return mask for batch of points (N, D)
+        """
+        return np.all((p >= self.lows) & (p <= self.highs), axis=-1)
 
     def gen_in_range(self, cb):
         for i in range(100):
             val = cb()
             if self.in_range(val):
                 return val
-        return None
+
+        # in higher dimensions nearly every sample near the border is out of range
+        return self.cap(val)
 
     def cap(self, arg):
-        for dim, limits in enumerate(self.sizes):
-            arg[dim] = max(limits[0], min(arg[dim], limits[1]))
-        return arg
+        return np.clip(arg, self.lows, self.highs, out=arg)
 
     def make_unit(self, arg, fn, **kwargs):
         capped = self.cap(arg)
@@ -52,6 +63,14 @@ class Space:
 
         return unit
 
+    def make_units(self, args, fn):
+        """
+        evaluate whole (N, D) batch with single call of fn
+        """
+        capped = self.cap(args)
+        costs = fn(capped)
+        return [algorithms.Unit(arg, cost) for arg, cost in zip(capped, costs)]
+
 
 
 class MeasureContext:
@@ -70,13 +89,15 @@ class CountCallsProxy:
         self.fn = fn
         self.called_count = 0
 
-    def __call__(self, *args, **kwargs):
-        self.called_count += 1
-        return self.fn(*args, **kwargs)
+    def __call__(self, X, *args, **kwargs):
+        # batch of points (N, D) counts as N evaluations
+        X = np.asarray(X)
+        self.called_count += 1 if X.ndim <= 1 else int(np.prod(X.shape[:-1]))
+        return self.fn(X, *args, **kwargs)
 
 
 def all_functions():
-    return [getattr(test_functions, fn) for fn in dir(test_functions) if isinstance(getattr(test_functions, fn), types.FunctionType)]
+    return [getattr(test_functions, fn) for fn in dir(test_functions) if not fn.startswith('_') and isinstance(getattr(test_functions, fn), types.FunctionType)]
 
 
 def all_algorithms():
@@ -0,0 +1,162 @@
+"""
+External archive of non-dominated solutions found during the whole run.
+"""
+import heapq
+
+import numpy as np
+
+from nondominated import crowding_distance, nondominated_ranks
+
+EVICTIONS = ('crowding', 'grid')
+
+
+class ParetoArchive:
+    """
+    Non-dominated points kept sorted by the first objective.
+    Points dominating a candidate have lower or equal first objective and points dominated by it higher or equal,
+    so dominance checks scan only prefix or suffix found by binary search.
+    With two objectives the sorted points form a staircase and both checks are O(log N).
+    """
+
+    def __init__(self, capacity=None, eviction='crowding', divisions=16, maximize=False):
+        """
+        archive keeps at most capacity points, evicting the most crowded ones by crowding distance
+        or from the most populated cell of grid with divisions cells per objective
+        """
+        if eviction not in EVICTIONS:
+            raise ValueError(f"Unknown eviction '{eviction}', use one of {EVICTIONS}")
+
+        self.capacity = capacity
+        self.eviction = eviction
+        self.divisions = divisions
+        self.sign = -1 if maximize else 1
+
+        # minimized objectives and decision vectors of archived points
+        self.keys = None
+        self.solutions = None
+
+    def __len__(self):
+        return 0 if self.keys is None else len(self.keys)
+
+    @property
+    def objectives(self):
+        return self.sign * self.keys
+
+    def front(self):
+        """
+        decision vectors and objectives of archived points
+        """
+        return self.solutions, self.objectives
+
+    def dominated(self, f):
+        """
+        whether objective vector f is dominated by or equal to archived point
+        """
+        return bool(self.dominated_mask(self.sign * np.atleast_2d(np.asarray(f, dtype=np.float64)))[0])
+
+    def dominated_mask(self, K):
+        """
+        which of minimized objective vectors K are dominated by or equal to archived point
+        """
+        if not len(self):
+            return np.zeros(len(K), dtype=bool)
+
+        prefix = np.searchsorted(self.keys[:, 0], K[:, 0], side='right')
+        if K.shape[1] == 2:
+            # the last point of the prefix has the lowest second objective in it
+            return (prefix > 0) & (self.keys[prefix - 1, 1] <= K[:, 1])
+
+        return np.array([(self.keys[:end] <= k).all(axis=1).any() for end, k in zip(prefix, K)], dtype=bool)
+
+    def dominating_mask(self, K):
+        """
+        which archived points are dominated by some of minimized objective vectors K,
+        K must not contain point dominated by or equal to archived one
+        """
+        begin = np.searchsorted(self.keys[:, 0], K[:, 0], side='left')
+        if K.shape[1] == 2:
+            # second objective decreases along the staircase, dominated points form range after begin
+            end = np.searchsorted(-self.keys[:, 1], -K[:, 1], side='right')
+            ranges = np.zeros(len(self) + 1, dtype=int)
+            np.add.at(ranges, begin, 1)
+            np.add.at(ranges, np.maximum(begin, end), -1)
+            return np.cumsum(ranges[:-1]) > 0
+
+        mask = np.zeros(len(self), dtype=bool)
+        for start, k in zip(begin, K):
+            mask[start:] |= (self.keys[start:] >= k).all(axis=1)
+        return mask
+
+    def update(self, X, F):
+        """
+        add solutions X with objective values F, returns number of accepted solutions
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        K = self.sign * np.atleast_2d(np.asarray(F, dtype=np.float64))
+
+        # only distinct non-dominated candidates of the batch
+        _, unique = np.unique(K, axis=0, return_index=True)
+        X, K = X[unique], K[unique]
+        best = nondominated_ranks(K) == 0
+        X, K = X[best], K[best]
+
+        accepted = ~self.dominated_mask(K)
+        X, K = X[accepted], K[accepted]
+        if len(K) == 0:
+            return 0
+
+        order = np.argsort(K[:, 0], kind='stable')
+        X, K = X[order], K[order]
+
+        if len(self):
+            alive = ~self.dominating_mask(K)
+            self.keys = self.keys[alive]
+            self.solutions = self.solutions[alive]
+
+            positions = np.searchsorted(self.keys[:, 0], K[:, 0])
+            self.keys = np.insert(self.keys, positions, K, axis=0)
+            self.solutions = np.insert(self.solutions, positions, X, axis=0)
+        else:
+            self.keys = K
+            self.solutions = X
+
+        if self.capacity is not None and len(self) > self.capacity:
+            self.evict(len(self) - self.capacity)
+        return len(K)
+
+    def evict(self, count):
+        if self.eviction == 'crowding':
+            evicted = np.argpartition(crowding_distance(self.keys), count - 1)[:count]
+        else:
+            evicted = self.evict_grid(count)
+
+        keep = np.ones(len(self), dtype=bool)
+        keep[evicted] = False
+        self.keys = self.keys[keep]
+        self.solutions = self.solutions[keep]
+
+    def evict_grid(self, count):
+        """
+        indices of count random points taken one by one from the currently most populated grid cell
+        """
+        low = self.keys.min(axis=0)
+        span = self.keys.max(axis=0) - low
+        span[span == 0] = 1
+        cells = np.minimum((self.keys - low) / span * self.divisions, self.divisions - 1).astype(np.int64)
+        _, cell, sizes = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+        cell = cell.reshape(-1)
+
+        # members of each cell are consecutive in random order
+        members = np.lexsort((np.random.random(len(cell)), cell))
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        taken = np.zeros(len(sizes), dtype=int)
+
+        heap = [(-size, c) for c, size in enumerate(sizes.tolist())]
+        heapq.heapify(heap)
+        evicted = []
+        for _ in range(count):
+            size, c = heapq.heappop(heap)
+            evicted.append(members[starts[c] + taken[c]])
+            taken[c] += 1
+            heapq.heappush(heap, (size + 1, c))
+        return np.array(evicted)
@@ -0,0 +1,204 @@
+"""
+Quality indicators of (N, M) fronts, all objectives are minimized.
+"""
+from bisect import bisect_left
+
+import numpy as np
+
+from nondominated import nondominated_ranks
+
+# reference points compared at once in IGD, bounds temporary (CHUNK, N, M) arrays
+CHUNK = 1024
+
+
+class Staircase:
+    """
+    Non-dominated 2D points sorted by the first objective together with area they dominate up to reference.
+    Adding point costs binary search plus removal of the points it dominates.
+    """
+
+    def __init__(self, reference):
+        self.rx, self.ry = map(float, reference)
+        # xs are increasing and ys decreasing
+        self.xs = []
+        self.ys = []
+        self.volume = 0.0
+
+    def __len__(self):
+        return len(self.xs)
+
+    def dominated(self, x, y):
+        """
+        whether point is dominated by or equal to point of the staircase, or lies outside reference box
+        """
+        if x >= self.rx or y >= self.ry:
+            return True
+
+        k = bisect_left(self.xs, x)
+        if k < len(self.xs) and self.xs[k] == x and self.ys[k] <= y:
+            return True
+        return k > 0 and self.ys[k - 1] <= y
+
+    def add(self, x, y):
+        """
+        insert point, returns increase of dominated area
+        """
+        if self.dominated(x, y):
+            return 0.0
+
+        k = bisect_left(self.xs, x)
+        end = k
+        while end < len(self.xs) and self.ys[end] >= y:
+            end += 1
+
+        # area between the new point and the old staircase, split by removed points
+        level = self.ys[k - 1] if k > 0 else self.ry
+        left = x
+        delta = 0.0
+        for i in range(k, end):
+            delta += (self.xs[i] - left) * (level - y)
+            left, level = self.xs[i], self.ys[i]
+        right = self.xs[end] if end < len(self.xs) else self.rx
+        delta += (right - left) * (level - y)
+
+        self.xs[k:end] = [x]
+        self.ys[k:end] = [y]
+        self.volume += delta
+        return delta
+
+    def points(self):
+        return np.column_stack([self.xs, self.ys]).reshape(-1, 2)
+
+
+def hypervolume_2d(F, reference):
+    order = np.lexsort((F[:, 1], F[:, 0]))
+    F = F[order]
+
+    # point is non-dominated when it improves the best second objective seen so far
+    best = np.minimum.accumulate(F[:, 1])
+    keep = np.ones(len(F), dtype=bool)
+    keep[1:] = F[1:, 1] < best[:-1]
+    F = F[keep]
+
+    widths = np.diff(np.append(F[:, 0], reference[0]))
+    return float(np.add.reduce(widths * (reference[1] - F[:, 1])))
+
+
+def hypervolume_3d(F, reference):
+    """
+    sweep along the third objective, area of the slices is maintained by staircase
+    """
+    F = F[np.argsort(F[:, 2], kind='stable')]
+    heights = np.diff(np.append(F[:, 2], reference[2]))
+
+    staircase = Staircase(reference[:2])
+    volume = 0.0
+    for (x, y, _), height in zip(F.tolist(), heights):
+        staircase.add(x, y)
+        volume += staircase.volume * height
+    return volume
+
+
+def hypervolume_monte_carlo(F, reference, samples):
+    ideal = F.min(axis=0)
+    box = np.prod(reference - ideal)
+
+    dominated = 0
+    for start in range(0, samples, CHUNK):
+        points = np.random.uniform(ideal, reference, size=(min(CHUNK, samples - start), len(reference)))
+        dominated += np.count_nonzero((F[np.newaxis] <= points[:, np.newaxis]).all(axis=2).any(axis=1))
+    return float(box * dominated / samples)
+
+
+def hypervolume(F, reference, samples=100000):
+    """
+    volume dominated by F and bounded by reference point,
+    exact for 2 and 3 objectives, Monte-Carlo estimate from samples points for more
+    """
+    F = np.asarray(F, dtype=np.float64)
+    reference = np.asarray(reference, dtype=np.float64)
+    F = F[(F < reference).all(axis=1)]
+    if len(F) == 0:
+        return 0.0
+
+    if len(reference) == 2:
+        return hypervolume_2d(F, reference)
+    if len(reference) == 3:
+        return hypervolume_3d(F, reference)
+    return hypervolume_monte_carlo(F, reference, samples)
+
+
+class IncrementalHypervolume:
+    """
+    Hypervolume of all points passed to update so far.
+    Two objectives keep staircase updated point by point, more objectives recompute volume of merged front.
+    """
+
+    def __init__(self, reference, samples=100000):
+        self.reference = np.asarray(reference, dtype=np.float64)
+        self.samples = samples
+        self.staircase = Staircase(self.reference) if len(self.reference) == 2 else None
+        self.front = np.empty((0, len(self.reference)))
+        self.volume = 0.0
+
+    def update(self, F):
+        F = np.asarray(F, dtype=np.float64)
+        if self.staircase is not None:
+            for x, y in F.tolist():
+                self.staircase.add(x, y)
+            self.volume = self.staircase.volume
+            return self.volume
+
+        F = F[(F < self.reference).all(axis=1)]
+        if len(F) == 0:
+            return self.volume
+
+        merged = np.concatenate([self.front, F])
+        self.front = merged[nondominated_ranks(merged) == 0]
+        self.volume = hypervolume(self.front, self.reference, self.samples)
+        return self.volume
+
+
+def igd(F, reference_front):
+    """
+    inverted generational distance, mean distance from points of reference front to nearest point of F
+    """
+    F = np.asarray(F, dtype=np.float64)
+    reference_front = np.asarray(reference_front, dtype=np.float64)
+
+    nearest = np.empty(len(reference_front))
+    for start in range(0, len(reference_front), CHUNK):
+        diff = reference_front[start:start + CHUNK, np.newaxis] - F[np.newaxis]
+        nearest[start:start + CHUNK] = np.sqrt(np.add.reduce(diff * diff, axis=2)).min(axis=1)
+    return float(nearest.mean())
+
+
+def spread(F, extremes=None):
+    """
+    Deb's spread of front, 0 for evenly distributed points.
+    Two objectives use gaps between neighbours along the front, more objectives distances to nearest neighbour.
+    extremes are optional (2, M) end points of the true front.
+    """
+    F = np.unique(np.asarray(F, dtype=np.float64), axis=0)
+    if len(F) < 2:
+        return 0.0
+
+    if F.shape[1] == 2:
+        F = F[np.argsort(F[:, 0])]
+        gaps = np.sqrt(np.add.reduce(np.diff(F, axis=0) ** 2, axis=1))
+    else:
+        diff = F[:, np.newaxis] - F[np.newaxis]
+        distances = np.sqrt(np.add.reduce(diff * diff, axis=2))
+        np.fill_diagonal(distances, np.inf)
+        gaps = distances.min(axis=1)
+
+    ends = 0.0
+    if extremes is not None:
+        extremes = np.asarray(extremes, dtype=np.float64)
+        ends = sum(np.sqrt(np.add.reduce((F - extreme) ** 2, axis=1)).min() for extreme in extremes)
+
+    mean = gaps.mean()
+    denominator = ends + len(gaps) * mean
+    if denominator == 0:
+        return 0.0
+    return float((ends + np.abs(gaps - mean).sum()) / denominator)
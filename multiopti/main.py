@@ -1,151 +1,88 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import random
-import time
-
-def nondominated_sort(P):
-    v_f1 = f1(P)
-    v_f2 = f2(P)
-
-    n = [0 for i in range(len(P))]
-    S = [set() for i in range(len(P))]
-    ranks = [0 for i in range(len(P))]
-    fronts = [set() for i in range(len(P))]
-
-    for p in range(len(P)):
-        for q in range(len(P)):
-            if p == q:
-                continue
-
-            if v_f1[p] >= v_f1[q] and v_f2[p] >= v_f2[q]:
-                S[p].add(q)
-            elif v_f1[q] >= v_f1[p] and v_f2[q] >= v_f2[p]:
-                n[p] += 1
-
-        if n[p] == 0:
-            ranks[p] = 1
-            fronts[0].add(p)
-
-    i = 0
-    while len(fronts[i]) > 0 and i + 1 < len(P):
-        Q = set()
-        for p in fronts[i]:
-            for q in S[p]:
-                n[q] -= 1
-                if n[q] == 0:
-                    ranks[q] += 1
-                    Q.add(q)
-
-        i += 1
-        fronts[i] = Q
-
-    return fronts
-
-
-def graph(points):
-    xs = [i for i in points]
-    ys = []
-
-    for x in xs:
-        if f1(x) > f2(x):
-            ys.append(f1(x))
-        else:
-            ys.append(f2(x))
-
-    plt.scatter(xs, ys)
-
-
-def assign(I):
-    distances = [0 for i in range(len(I))]
-
-    for fn in [f1, f2]:
-        I = sorted(I, key=fn)
+import argparse
 
-        distances[0] = distances[-1] = 10000000
-        for i in range(1, len(I) - 1):
-            distances[i] += fn(I[i + 1]) - fn(I[i - 1])
-
-    return sorted(zip(distances, I))
-
-def select(pop):
-    vals = [val for val, _ in pop]
-    m = min(vals)
-    M = max(vals)
-
-    def fit(val):
-        return (val - m) / (M - m + 0.000001)
-
-    fitness = [(fit(cost), x) for cost, x in pop]
-
-    r = random.uniform(0, 1)
-    cumsum = 0
-    for prop, x in fitness:
-        cumsum += prop
-        if cumsum > r:
-            return pop[0][1], x
-
-    return pop[0][1], pop[1][1]
-
-def crossover(a, b):
-    return (a + b) / 2
-
-
-def mutate(a):
-    return a + np.random.normal()
-
-
-def evolution(pop):
-    evoluted = []
-
-    for i in range(len(pop)):
-        a, b = select(pop)
-        evoluted.append(mutate(crossover(a, b)))
+import matplotlib.pyplot as plt
+import numpy as np
 
-    return evoluted
+from nsga import NSGA2, Objectives
 
 start, end = -60, 60
-NP = 20
 
-f1 = lambda x: -x**2
-f2 = lambda x: -(x-2)**2
 
-x = np.linspace(start, end, 1000)
+def f1(X):
+    return -X[:, 0] ** 2
 
-# create initial population
-#P = np.array([-2, -1, 0, 2, 4, 1])
-P = np.random.uniform(start, end, size=NP)
 
-for generation in range(1, 20):
-    fronts = nondominated_sort(P)
-    print("fronts", fronts)
+def f2(X):
+    return -(X[:, 0] - 2) ** 2
 
-    new_pop = []
-    i = 0
-    while len(new_pop) + len(fronts[i]) < NP:
-        for cost, idx in assign(fronts[i]):
-            new_pop.append((cost, P[idx]))
-        i += 1
 
-    for cost, idx in assign(fronts[i])[0:NP - len(new_pop)]:
-        new_pop.append((cost, P[idx]))
+def graph(points, values):
+    plt.scatter(points, values.max(axis=1))
 
-    P = np.array(list([x for _, x in new_pop]) + evolution(new_pop))
-    print("P", P)
+
+def plot(generation, x, curves):
+    P = generation.population[:, 0]
+    F = generation.objectives
 
     plt.clf()
     plt.subplot(2, 1, 1)
-    plt.plot(x, f1(x))
-    plt.plot(x, f2(x))
-    for p in fronts:
-        graph([P[i] for i in p])
+    plt.plot(x, curves[0])
+    plt.plot(x, curves[1])
+    for p in generation.fronts:
+        graph(P[p], F[p])
 
     plt.subplot(2, 1, 2)
     plt.xlim([-1, 3])
     plt.ylim([-4, 1])
-    plt.plot(x, f1(x))
-    plt.plot(x, f2(x))
-    for p in fronts:
-        graph([P[i] for i in p])
-
-    plt.show()
-    time.sleep(1)
+    plt.plot(x, curves[0])
+    plt.plot(x, curves[1])
+    for p in generation.fronts:
+        graph(P[p], F[p])
+
+    plt.pause(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NSGA-II on two maximized parabolas")
+    parser.add_argument("--popsize", type=int, default=20)
+    parser.add_argument("--generations", type=int, default=19)
+    parser.add_argument("--mutation", type=float, default=1.0)
+    parser.add_argument("--reference", nargs=2, type=float, default=[-10, -10],
+                        help="reference point of hypervolume")
+    parser.add_argument("--archive-capacity", type=int, default=100)
+    parser.add_argument("--plot", action='store_true', help="draw fronts of every generation")
+    args = parser.parse_args()
+
+    x = np.linspace(start, end, 1000)
+    curves = f1(x[:, np.newaxis]), f2(x[:, np.newaxis])
+
+    objectives = Objectives(f1, f2)
+    engine = NSGA2(objectives, bounds=[(start, end)])
+    opts = {
+        'popsize': args.popsize,
+        'generations': args.generations,
+        'mutation': args.mutation,
+        'maximize': True,
+        'reference': args.reference,
+        'archive': True,
+        'archive_capacity': args.archive_capacity,
+    }
+
+    for generation in engine.run(opts):
+        pareto = generation.population[generation.pareto, 0]
+        print(f"generation {generation.generation}, evaluations {objectives.called_count}, "
+              f"fronts {len(generation.fronts)}, pareto {len(pareto)} in [{pareto.min():.3f}, {pareto.max():.3f}], "
+              f"hypervolume {generation.indicators['hypervolume']:.3f}, spread {generation.indicators['spread']:.3f}")
+
+        if args.plot:
+            plot(generation, x, curves)
+
+    archived, values = engine.archive.front()
+    print(f"archive {len(archived)} solutions in [{archived[:, 0].min():.3f}, {archived[:, 0].max():.3f}]")
+
+    if args.plot:
+        plt.show()
+
+
+if __name__ == '__main__':
+    main()
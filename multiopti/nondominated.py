@@ -0,0 +1,112 @@
+"""
+Non-dominated sorting of (N, M) objective matrix, all objectives are minimized.
+Fronts are returned as arrays of indices into the objective matrix, best front first.
+"""
+from bisect import bisect_right
+
+import numpy as np
+
+# rows of the dominance matrix compared at once, bounds temporary (CHUNK, N, M) arrays
+CHUNK = 256
+
+
+def dominance_matrix(F):
+    """
+    (N, N) boolean matrix, D[p, q] is True when p dominates q
+    """
+    N = len(F)
+    D = np.empty((N, N), dtype=bool)
+    for start in range(0, N, CHUNK):
+        rows = F[start:start + CHUNK, np.newaxis]
+        D[start:start + CHUNK] = (rows <= F[np.newaxis]).all(axis=2) & (rows < F[np.newaxis]).any(axis=2)
+    return D
+
+
+def ranks_dominance(F):
+    """
+    front index of each point by peeling fronts off the dominance matrix, O(M N^2)
+    """
+    D = dominance_matrix(F)
+    dominated_by = D.sum(axis=0)
+    ranks = np.full(len(F), -1)
+
+    rank = 0
+    front = np.flatnonzero(dominated_by == 0)
+    while len(front):
+        ranks[front] = rank
+        dominated_by -= D[front].sum(axis=0)
+        dominated_by[front] = -1
+        front = np.flatnonzero(dominated_by == 0)
+        rank += 1
+
+    return ranks
+
+
+def ranks_2d(F):
+    """
+    front index of each point for two objectives, O(N log N) sweep with binary search of fronts (ENS-BS)
+    """
+    # duplicates share the front, sweep only distinct points
+    points, inverse = np.unique(F, axis=0, return_inverse=True)
+
+    # points are sorted by first objective, so point is dominated by front
+    # exactly when the last point of the front has lower or equal second objective
+    last = []
+    ranks = np.empty(len(points), dtype=int)
+    for i, f2 in enumerate(points[:, 1].tolist()):
+        rank = bisect_right(last, f2)
+        if rank == len(last):
+            last.append(f2)
+        else:
+            last[rank] = f2
+        ranks[i] = rank
+
+    return ranks[inverse.reshape(-1)]
+
+
+def fronts_from_ranks(ranks):
+    order = np.argsort(ranks, kind='stable')
+    bounds = np.flatnonzero(np.diff(ranks[order])) + 1
+    return np.split(order, bounds)
+
+
+def crowding_distance(F):
+    """
+    crowding distance of each point of single front, objectives are normalized by their range
+    """
+    N, M = F.shape
+    if N <= 2:
+        return np.full(N, np.inf)
+
+    order = np.argsort(F, axis=0, kind='stable')
+    values = np.take_along_axis(F, order, axis=0)
+    span = values[-1] - values[0]
+    span[span == 0] = 1
+
+    # gap between neighbours of each inner point along every objective
+    gaps = np.zeros((N, M))
+    np.put_along_axis(gaps, order[1:-1], (values[2:] - values[:-2]) / span, axis=0)
+    distances = gaps.sum(axis=1)
+
+    distances[order[0]] = np.inf
+    distances[order[-1]] = np.inf
+    return distances
+
+
+def nondominated_ranks(F):
+    F = np.asarray(F, dtype=np.float64)
+    if len(F) == 0:
+        return np.empty(0, dtype=int)
+    if F.shape[1] == 2:
+        return ranks_2d(F)
+    return ranks_dominance(F)
+
+
+def nondominated_sort(F):
+    """
+    list of fronts as index arrays
+    """
+    ranks = nondominated_ranks(F)
+    if len(ranks) == 0:
+        return []
+    return fronts_from_ranks(ranks)
@@ -0,0 +1,179 @@
+"""
+NSGA-II over N-dimensional decision vectors and M objectives.
+
+    engine = NSGA2(Objectives(f1, f2), bounds=[(-60, 60)])
+    for generation in engine.run({'generations': 100}):
+        print(generation.evaluations, len(generation.fronts[0]))
+"""
+import numpy as np
+
+from archive import ParetoArchive
+from indicators import IncrementalHypervolume, igd, spread
+from nondominated import crowding_distance, nondominated_ranks, fronts_from_ranks
+
+
+class Objectives:
+    """
+    evaluates all objectives of (N, D) population into (N, M) matrix and counts evaluated individuals
+    """
+
+    def __init__(self, *fns):
+        self.fns = fns
+        self.called_count = 0
+
+    def __call__(self, P):
+        P = np.asarray(P)
+        self.called_count += len(P)
+        return np.stack([fn(P) for fn in self.fns], axis=1)
+
+
+def tournament(ranks, crowding, shape):
+    """
+    indices of binary tournament winners, lower rank wins and higher crowding breaks ties
+    """
+    a = np.random.randint(len(ranks), size=shape)
+    b = np.random.randint(len(ranks), size=shape)
+    better = (ranks[b] < ranks[a]) | ((ranks[b] == ranks[a]) & (crowding[b] > crowding[a]))
+    return np.where(better, b, a)
+
+
+def survive(F, count):
+    """
+    indices of count best points by (rank, -crowding) together with their ranks and crowding distances
+    """
+    ranks = nondominated_ranks(F)
+    crowding = np.zeros(len(F))
+
+    # crowding is needed only up to the front which does not fit whole
+    taken = 0
+    for front in fronts_from_ranks(ranks):
+        crowding[front] = crowding_distance(F[front])
+        taken += len(front)
+        if taken >= count:
+            break
+
+    survivors = np.lexsort((-crowding, ranks))[:count]
+    return survivors, ranks[survivors], crowding[survivors]
+
+
+class Generation:
+    def __init__(self, generation, population, objectives, ranks, crowding, evaluations, indicators):
+        self.generation = generation
+        self.population = population
+        self.objectives = objectives
+        self.ranks = ranks
+        self.crowding = crowding
+        self.evaluations = evaluations
+        self.indicators = indicators
+
+    @property
+    def fronts(self):
+        return fronts_from_ranks(self.ranks)
+
+    @property
+    def pareto(self):
+        return np.flatnonzero(self.ranks == 0)
+
+
+class NSGA2:
+    defaults = {
+        'popsize': 100,
+        'generations': 100,
+        # standard deviation of gaussian mutation
+        'mutation': 1.0,
+        # objectives are minimized unless set
+        'maximize': False,
+        # reference point of hypervolume of all evaluated points, no hypervolume when None
+        'reference': None,
+        # points of the true front for IGD, no IGD when None
+        'reference_front': None,
+        # keep all non-dominated solutions found in external archive
+        'archive': False,
+        'archive_capacity': None,
+        # 'crowding' or 'grid'
+        'archive_eviction': 'crowding',
+    }
+
+    def __init__(self, objectives, bounds):
+        """
+        objectives map (N, D) population to (N, M) matrix, bounds are (low, high) of each dimension
+        """
+        self.objectives = objectives
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.lows = self.bounds[:, 0]
+        self.highs = self.bounds[:, 1]
+        # indicators of every generation of the last run
+        self.history = []
+        # non-dominated solutions of the last run, None without archive
+        self.archive = None
+
+    def run(self, opts):
+        for key in opts.keys():
+            if key not in self.defaults:
+                raise KeyError(f"Unknown parameter '{key}'")
+        opts = {**self.defaults, **opts}
+
+        popsize = opts['popsize']
+        sign = -1 if opts['maximize'] else 1
+
+        volume = None
+        if opts['reference'] is not None:
+            volume = IncrementalHypervolume(sign * np.asarray(opts['reference'], dtype=np.float64))
+        reference_front = None
+        if opts['reference_front'] is not None:
+            reference_front = sign * np.asarray(opts['reference_front'], dtype=np.float64)
+        self.history = []
+        self.archive = None
+        if opts['archive']:
+            self.archive = ParetoArchive(opts['archive_capacity'], opts['archive_eviction'], maximize=opts['maximize'])
+
+        def measure(generation, F, new, ranks):
+            indicators = {'generation': generation, 'evaluations': evaluated}
+            front = sign * F[ranks == 0]
+            if volume is not None:
+                # hypervolume of everything evaluated so far, only the new points need to be added
+                indicators['hypervolume'] = volume.update(sign * new)
+            if reference_front is not None:
+                indicators['igd'] = igd(front, reference_front)
+            indicators['spread'] = spread(front)
+
+            self.history.append(indicators)
+            return indicators
+
+        P = np.random.uniform(self.lows, self.highs, size=(popsize, len(self.bounds)))
+        # objective values of P, every individual is evaluated exactly once
+        F = self.objectives(P)
+        evaluated = popsize
+        if self.archive is not None:
+            self.archive.update(P, F)
+
+        survivors, ranks, crowding = survive(sign * F, popsize)
+        P = P[survivors]
+        F = F[survivors]
+        indicators = measure(0, F, F, ranks)
+        yield Generation(0, P, F, ranks, crowding, evaluated, indicators)
+
+        for generation in range(1, opts['generations'] + 1):
+            offspring = self.make_offspring(P, ranks, crowding, opts)
+            offspring_objectives = self.objectives(offspring)
+
+            P = np.concatenate([P, offspring])
+            F = np.concatenate([F, offspring_objectives])
+            evaluated += len(offspring)
+            if self.archive is not None:
+                self.archive.update(offspring, offspring_objectives)
+
+            survivors, ranks, crowding = survive(sign * F, popsize)
+            P = P[survivors]
+            F = F[survivors]
+
+            indicators = measure(generation, F, offspring_objectives, ranks)
+            yield Generation(generation, P, F, ranks, crowding, evaluated, indicators)
+
+    def make_offspring(self, P, ranks, crowding, opts):
+        parents = tournament(ranks, crowding, (len(P), 2))
+
+        # arithmetic crossover followed by gaussian mutation
+        children = (P[parents[:, 0]] + P[parents[:, 1]]) / 2
+        children += np.random.normal(scale=opts['mutation'], size=children.shape)
+        return np.clip(children, self.lows, self.highs)
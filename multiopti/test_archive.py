@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+import numpy as np
+
+from archive import ParetoArchive
+from nondominated import nondominated_ranks
+
+
+def sorted_rows(F):
+    return F[np.lexsort(F.T[::-1])]
+
+
+class TestArchive(TestCase):
+    def test_update(self):
+        for M in [2, 3]:
+            for size in [3, 10, 100]:
+                for _ in range(20):
+                    archive = ParetoArchive()
+                    seen = np.empty((0, M))
+                    for _ in range(5):
+                        # small grid gives ties in objectives and points equal to archived ones
+                        F = np.random.randint(0, size, (np.random.randint(1, 20), M)).astype(np.float64)
+                        archive.update(F, F)
+                        seen = np.concatenate([seen, F])
+
+                        expected = np.unique(seen[nondominated_ranks(seen) == 0], axis=0)
+                        np.testing.assert_array_equal(sorted_rows(expected), sorted_rows(archive.keys))
+                        np.testing.assert_array_equal(archive.keys, archive.solutions)
+                        self.assertTrue((np.diff(archive.keys[:, 0]) >= 0).all())
+
+    def test_capacity(self):
+        for eviction in ['crowding', 'grid']:
+            for M in [2, 3]:
+                archive = ParetoArchive(capacity=10, eviction=eviction)
+                for _ in range(10):
+                    F = np.random.rand(30, M)
+                    # points on a sphere are mutually non-dominated, so the archive overflows
+                    F /= np.linalg.norm(F, axis=1, keepdims=True)
+                    archive.update(F, F)
+
+                    self.assertEqual(10, len(archive))
+                    self.assertTrue((nondominated_ranks(archive.keys) == 0).all())
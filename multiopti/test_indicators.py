@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+import numpy as np
+
+from indicators import IncrementalHypervolume, hypervolume, hypervolume_3d, hypervolume_monte_carlo, igd, spread
+
+REFERENCE = np.array([10., 10.])
+
+
+def grid_area(F, reference):
+    """
+    dominated area of integer points counted by unit cells of grid
+    """
+    cells = np.stack(np.meshgrid(np.arange(reference[0]), np.arange(reference[1])), axis=-1).reshape(-1, 2)
+    return float(np.count_nonzero((F[np.newaxis] <= cells[:, np.newaxis]).all(axis=2).any(axis=1)))
+
+
+class TestIndicators(TestCase):
+    def test_hypervolume_2d(self):
+        for n in [1, 2, 5, 20, 50]:
+            for _ in range(20):
+                # reaches past the reference point and repeats points
+                F = np.random.randint(0, 12, (n, 2)).astype(np.float64)
+                expected = grid_area(F, REFERENCE)
+
+                self.assertAlmostEqual(expected, hypervolume(F, REFERENCE))
+                self.assertAlmostEqual(expected, IncrementalHypervolume(REFERENCE).update(F))
+
+    def test_incremental_hypervolume(self):
+        for n in [2, 5, 20, 50]:
+            for _ in range(20):
+                F = np.random.randint(0, 12, (n, 2)).astype(np.float64)
+                bounds = np.sort(np.random.randint(0, n + 1, 3))
+
+                indicator = IncrementalHypervolume(REFERENCE)
+                for batch in np.split(F, bounds):
+                    volume = indicator.update(batch)
+                self.assertAlmostEqual(grid_area(F, REFERENCE), volume)
+
+    def test_hypervolume_3d(self):
+        np.random.seed(0)
+        reference = np.ones(3)
+        for n in [1, 2, 10, 50]:
+            F = np.random.rand(n, 3)
+            # points on a sphere are mutually non-dominated
+            F = np.concatenate([F, 1 - F / np.linalg.norm(F, axis=1, keepdims=True) * 0.9])
+
+            expected = hypervolume_monte_carlo(F, reference, 200000)
+            self.assertAlmostEqual(expected, hypervolume_3d(F, reference), delta=0.01)
+            self.assertAlmostEqual(hypervolume_3d(F, reference), IncrementalHypervolume(reference).update(F))
+
+    def test_igd(self):
+        F = np.random.rand(20, 3)
+        self.assertEqual(0, igd(F, F))
+
+        # nearest points are at distances 1 and 3
+        self.assertAlmostEqual(2, igd([[0, 0], [3, 4]], [[0, 1], [3, 0]]))
+
+    def test_spread(self):
+        even = np.array([[0, 3], [1, 2], [2, 1], [3, 0]])
+        self.assertAlmostEqual(0, spread(even))
+        self.assertAlmostEqual(0, spread(even, extremes=[[0, 3], [3, 0]]))
+        self.assertAlmostEqual(0, spread(np.column_stack([even, even[:, 0]])))
+
+        uneven = np.array([[0, 3], [0.5, 2.5], [3, 0]])
+        self.assertGreater(spread(uneven), 0)
+        self.assertGreater(spread(np.column_stack([uneven, uneven[:, 0]])), 0)
@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+import numpy as np
+
+from nondominated import crowding_distance, ranks_2d, ranks_dominance
+
+
+class TestNondominated(TestCase):
+    def test_ranks_2d(self):
+        for n in [1, 2, 5, 20, 100]:
+            for size in [2, 3, 10]:
+                for _ in range(20):
+                    # small grid gives ties in either objective and duplicate points
+                    F = np.random.randint(0, size, (n, 2)).astype(np.float64)
+                    np.testing.assert_array_equal(ranks_dominance(F), ranks_2d(F))
+
+    def test_ranks_2d_duplicates(self):
+        F = np.array([[1, 1], [0, 2], [1, 1], [2, 0], [1, 2], [1, 2], [2, 2]], dtype=np.float64)
+        np.testing.assert_array_equal([0, 0, 0, 0, 1, 1, 2], ranks_2d(F))
+
+    def test_crowding_distance(self):
+        F = np.array([[3, 1], [0, 5], [4, 0], [1, 3]], dtype=np.float64)
+        # inner points sum gaps between neighbours normalized by ranges 4 and 5
+        np.testing.assert_allclose([3 / 4 + 3 / 5, np.inf, np.inf, 3 / 4 + 4 / 5], crowding_distance(F))
+
+    def test_crowding_distance_small(self):
+        np.testing.assert_array_equal([np.inf, np.inf], crowding_distance(np.array([[0., 1.], [1., 0.]])))
@@ -1,6 +1,10 @@
-from common import Trajectory, Evaluator
+from common import Trajectory, GenerationReport, check_report, make_evaluator, should_report
+from local_search import LocalSearch
 import numpy as np
 
+# which tours deposit pheromones after generation
+DEPOSITS = ('all', 'iteration_best', 'global_best')
+
 
 class AntColony:
     defaults = {
@@ -9,66 +13,198 @@ class AntColony:
         'ro': 0.5,
         'Q': 100,
         'initial_pheromones': 0.2,
-        'max_generations': 100
+        'max_generations': 100,
+        'local_search': False,
+        'neighbours': 10,
+        'lockstep': False,
+        # number of nearest cities tried first during construction, 0 to consider all cities
+        'candidates': 0,
+        # which tours deposit pheromones: 'all', 'iteration_best' or 'global_best'
+        'deposit': 'all',
+        # MAX-MIN Ant System, bound pheromones to [tau_max / (2 * N), Q / ((1 - ro) * best)]
+        'max_min': False,
+        # yield after every 'tour', 'generation', every K generations or only on 'improvement'
+        'report': 'tour',
     }
 
     def __init__(self, cities, popsize):
-        self.evaluator = Evaluator(cities)
-        self.cities = [(city.x, city.y) for city in cities]
+        self.evaluator = make_evaluator(cities)
+        if not isinstance(self.evaluator.distances, np.ndarray):
+            raise ValueError("AntColony needs dense distance matrix, pheromones are N x N anyway")
         self.popsize = popsize
+        # number of finished generations
+        self.generation = 0
+        # tours received from other colonies, they deposit pheromones in the next update
+        self.immigrants = []
 
     def run(self, opts):
         for key in opts.keys():
             if key not in self.defaults:
                 raise KeyError(f"Unknown parameter '{key}'")
         opts = {**self.defaults, **opts}
+        check_report(opts['report'])
+        if opts['deposit'] not in DEPOSITS:
+            raise ValueError(f"Unknown deposit '{opts['deposit']}', use one of {DEPOSITS}")
 
-        N = len(self.cities)
-        all_cities = set(range(N))
+        N = self.evaluator.hops
         best = None
         pheromones = np.full((N, N), opts['initial_pheromones'])
+        local_search = LocalSearch(self.evaluator, opts['neighbours']) if opts['local_search'] else None
+
+        # heuristic part of the transition probability does not change between generations
+        with np.errstate(divide='ignore'):
+            heuristic = (1 / self.evaluator.distances) ** opts['beta']
+        heuristic[~np.isfinite(heuristic)] = 0
+
+        candidates = self.evaluator.nearest(opts['candidates']) if opts['candidates'] else None
+
+        # each ant starts in different city
+        starts = np.arange(N)
+        reported = True
 
         for generation in range(opts['max_generations']):
+            weights = pheromones ** opts['alfa'] * heuristic
+
+            if opts['lockstep']:
+                trajectories = self.construct_all(weights, starts, candidates)
+            else:
+                trajectories = np.array([self.construct(weights, start, candidates) for start in starts])
+            distances = self.evaluator.cost_many(trajectories)
+
             paths = []
-            # each ant starts in different city
-            for cur_city in all_cities:
-                trajectory = [cur_city]
+            improved = False
+            for trajectory, distance in zip(trajectories.tolist(), distances):
+                if local_search:
+                    trajectory, distance = local_search.improve(trajectory, distance)
+                new = Trajectory(trajectory, distance=distance)
+                if not best or best.distance > new.distance:
+                    best = new
+                    improved = True
+
+                paths.append(new)
+                if opts['report'] == 'tour':
+                    yield best, new
+
+            report = GenerationReport.of(paths, self.generation, self.evaluator.evaluations)
+
+            for immigrant in self.immigrants:
+                if best.distance > immigrant.distance:
+                    best = immigrant
+                    improved = True
+            paths += self.immigrants
+            self.immigrants = []
+
+            self.update_pheromones(pheromones, paths, opts, best)
+            self.generation += 1
+
+            reported = should_report(opts['report'], self.generation, improved)
+            if reported:
+                yield best, report
 
-                while True:
-                    remaining_cities = all_cities - set(trajectory)
-                    if not remaining_cities:
-                        new = Trajectory(trajectory, distance=self.evaluator.cost(trajectory))
-                        if not best or best.distance > new.distance:
-                            best = new
+        if not reported and opts['report'] != 'tour':
+            # last generation is always reported
+            yield best, report
 
-                        paths.append(new)
-                        yield best, new
-                        break
+    def construct(self, weights, start, candidates=None):
+        """
+        build tour of single ant
+        """
+        N = len(weights)
+        visited = np.zeros(N, dtype=bool)
+        trajectory = np.empty(N, dtype=int)
+        trajectory[0] = start
+        visited[start] = True
 
-                    cur_city = self.choose_next_path(pheromones, cur_city, remaining_cities, opts)
-                    trajectory.append(cur_city)
+        for step in range(1, N):
+            prev = trajectory[step - 1]
+            cur_city = None
+            if candidates is not None:
+                # try nearest cities first, fall back to all cities when they are exhausted
+                near = candidates[prev]
+                cur_city = self.choose_next_path(weights[prev, near], visited[near], fallback=False)
+                if cur_city is not None:
+                    cur_city = near[cur_city]
 
-            self.update_pheromones(pheromones, paths, opts)
+            if cur_city is None:
+                cur_city = self.choose_next_path(weights[prev], visited)
 
-    def choose_next_path(self, pheromones, cur_city, remaining_cities, opts):
-        def cost(candidate):
-            return pheromones[cur_city, candidate] ** opts['alfa'] * 1 / self.evaluator.distances[cur_city, candidate] ** opts['beta']
+            trajectory[step] = cur_city
+            visited[cur_city] = True
 
-        bottom = sum(map(cost, remaining_cities))
-        cumulated = 0
-        r = np.random.uniform()
-        for j in remaining_cities:
-            cumulated += cost(j) / bottom
+        return trajectory
 
-            if cumulated >= r:
-                return j
+    def choose_next_path(self, weights, visited, fallback=True):
+        weights = np.where(visited, 0, weights)
+        if not weights.any():
+            if not fallback or visited.all():
+                return None
+            weights = (~visited).astype(float)
 
-    def update_pheromones(self, pheromones, paths, opts):
+        cumulated = np.cumsum(weights)
+        r = np.random.uniform() * cumulated[-1]
+        return min(np.searchsorted(cumulated, r, side='right'), len(weights) - 1)
+
+    def construct_all(self, weights, starts, candidates=None):
+        """
+        build tours of all ants in lockstep, one step of every ant at once
+        """
+        ants = np.arange(len(starts))
+        visited = np.zeros((len(starts), len(weights)), dtype=bool)
+        trajectories = np.empty((len(starts), len(weights)), dtype=int)
+        trajectories[:, 0] = starts
+        visited[ants, starts] = True
+
+        for step in range(1, len(weights)):
+            prev = trajectories[:, step - 1]
+            cur_cities = np.empty(len(starts), dtype=int)
+            pending = ants
+
+            if candidates is not None:
+                # try nearest cities first, fall back to all cities when they are exhausted
+                near = candidates[prev]
+                chosen, ok = self.choose_next_paths(weights[prev[:, np.newaxis], near], visited[ants[:, np.newaxis], near])
+                cur_cities[ok] = near[ok, chosen[ok]]
+                pending = ants[~ok]
+
+            if len(pending):
+                chosen, ok = self.choose_next_paths(weights[prev[pending]], visited[pending])
+                # ants with no attractive city left choose uniformly from unvisited ones
+                if not ok.all():
+                    chosen[~ok], _ = self.choose_next_paths(~visited[pending[~ok]], visited[pending[~ok]])
+                cur_cities[pending] = chosen
+
+            trajectories[:, step] = cur_cities
+            visited[ants, cur_cities] = True
+
+        return trajectories
+
+    def choose_next_paths(self, weights, visited):
+        """
+        vectorized choose_next_path for rows of weights, returns chosen columns and mask of rows with any choice
+        """
+        weights = np.where(visited, 0, weights).astype(float)
+        cumulated = np.cumsum(weights, axis=1)
+        r = np.random.uniform(size=len(weights)) * cumulated[:, -1]
+        chosen = np.minimum(np.count_nonzero(cumulated <= r[:, np.newaxis], axis=1), weights.shape[1] - 1)
+        return chosen, cumulated[:, -1] > 0
+
+    def update_pheromones(self, pheromones, paths, opts, best=None):
         # decay all pheromones
         pheromones *= opts['ro']
+
+        if opts['deposit'] == 'iteration_best':
+            paths = [min(paths, key=lambda path: path.distance)]
+        elif opts['deposit'] == 'global_best':
+            paths = [best]
+
         # strengthen pheromones on used paths
-        for path in paths:
-            p = path.path + [path.path[0]]
-            for a, b in zip(p, p[1:]):
-                pheromones[a][b] += opts['Q'] / path.distance
-                pheromones[b][a] += opts['Q'] / path.distance
+        trajectories = np.array([path.path for path in paths])
+        amount = np.repeat(opts['Q'] / np.array([path.distance for path in paths]), trajectories.shape[1])
+        a = trajectories.ravel()
+        b = np.roll(trajectories, -1, axis=1).ravel()
+        np.add.at(pheromones, (a, b), amount)
+        np.add.at(pheromones, (b, a), amount)
+
+        if opts['max_min']:
+            tau_max = opts['Q'] / ((1 - opts['ro']) * best.distance)
+            np.clip(pheromones, tau_max / (2 * len(pheromones)), tau_max, out=pheromones)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Run solvers x instances x samples without GUI and write JSON report.
+
+Each run is stopped after time limit or evaluation budget, whichever comes first,
+and records best-so-far tour length against time and evaluated tours.
+Instances are TSPLIB .tsp files, 'cities' stands for the built-in instance.
+
+Track performance of solvers by saving baseline and comparing later runs against it,
+regressions are worse tour length and less frequent reaching of target length or needing more evaluations for it.
+Seeds are fixed so these are reproducible; evaluation rates are wall-clock and compared only for runs
+longer than --min-time:
+
+    python benchmark.py --evaluations 20000 --targets '{"cities": 900}' -o report.json --save-baseline baseline.json
+    python benchmark.py --evaluations 20000 --targets '{"cities": 900}' -o report.json --baseline baseline.json
+"""
+import itertools
+import argparse
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer as timer
+
+import numpy as np
+
+import tsplib
+from antcolony import AntColony
+from cities import cities
+from genetic import Genetic
+
+SOLVERS = {
+    'ant': AntColony,
+    'genetic': Genetic,
+}
+
+
+def load_instance(name):
+    if name == 'cities':
+        return cities
+    return tsplib.load(name)
+
+
+def build_tasks(solvers, instances, samples, base_seed=0, popsize=20, options=None, time_limit=None,
+                evaluations=None, targets=None):
+    """
+    sample k of every solver and instance runs with the same seed, so solvers are compared on equal footing
+    """
+    options = options or {}
+    targets = targets or {}
+    seeds = np.random.SeedSequence(base_seed).generate_state(samples).tolist()
+
+    for solver, instance, (sample, seed) in itertools.product(solvers, instances, enumerate(seeds)):
+        # budgets are checked once per generation, per-tour reports would only add overhead
+        solver_options = {'report': 'generation', **options.get(solver, {})}
+        yield solver, solver_options, instance, popsize, sample, seed, time_limit, evaluations, targets.get(instance)
+
+
+def run_task(task):
+    solver, options, instance, popsize, sample, seed, time_limit, evaluations, target = task
+    random.seed(seed)
+    np.random.seed(seed)
+
+    algo = SOLVERS[solver](load_instance(instance), popsize)
+    evaluator = algo.evaluator
+
+    # (time, evaluations, best distance) whenever best tour improves
+    trace = []
+    best = None
+    time_to_target = None
+    start = timer()
+    for best, _ in algo.run(options):
+        elapsed = timer() - start
+        if not trace or best.distance < trace[-1][2]:
+            trace.append((elapsed, evaluator.evaluations, float(best.distance)))
+        if target is not None and time_to_target is None and best.distance <= target:
+            time_to_target = elapsed
+
+        if time_limit is not None and elapsed >= time_limit:
+            break
+        if evaluations is not None and evaluator.evaluations >= evaluations:
+            break
+
+    return {
+        'solver': solver,
+        'instance': instance,
+        'sample': sample,
+        'seed': seed,
+        'best': float(best.distance),
+        'tour': list(map(int, best.path)),
+        'evaluations': evaluator.evaluations,
+        'deltas': evaluator.deltas,
+        'generations': algo.generation,
+        'time': timer() - start,
+        'target': target,
+        'time_to_target': time_to_target,
+        'trace': trace,
+        'options': options,
+    }
+
+
+def evaluations_to_target(run):
+    """
+    evaluated tours when best tour first got to target length
+    """
+    return next(evaluations for _, evaluations, distance in run['trace'] if distance <= run['target'])
+
+
+def summarize(runs):
+    """
+    aggregate runs by solver and instance
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault(f"{run['solver']}:{run['instance']}", []).append(run)
+
+    summary = {}
+    for key, all_runs in groups.items():
+        group = [run for run in all_runs if 'error' not in run]
+        summary[key] = {
+            'samples': len(group),
+            'failures': len(all_runs) - len(group),
+        }
+        if not group:
+            continue
+
+        best = np.array([run['best'] for run in group])
+        time = sum(run['time'] for run in group)
+        reached = [run for run in group if run['time_to_target'] is not None]
+        summary[key].update({
+            'best_mean': float(best.mean()),
+            'best_std': float(best.std()),
+            'best_min': float(best.min()),
+            'evaluations_mean': float(np.mean([run['evaluations'] for run in group])),
+            'deltas_mean': float(np.mean([run['deltas'] for run in group])),
+            'time_mean': time / len(group),
+            # full O(N) tour evaluations and O(1) priced moves per second, kept apart as they cost differently
+            'evaluation_rate': sum(run['evaluations'] for run in group) / time if time else 0.0,
+            'delta_rate': sum(run['deltas'] for run in group) / time if time else 0.0,
+        })
+        if group[0]['target'] is not None:
+            summary[key]['target_reached'] = len(reached) / len(group)
+            summary[key]['evaluations_to_target_mean'] = \
+                float(np.mean([evaluations_to_target(run) for run in reached])) if reached else None
+            summary[key]['time_to_target_mean'] = \
+                float(np.mean([run['time_to_target'] for run in reached])) if reached else None
+    return summary
+
+
+def compare(summary, baseline, tolerance, time_tolerance, min_time):
+    """
+    list of regressions against baseline, tour length and evaluations to target are compared with tolerance,
+    rates with time_tolerance (both relative) only when runs took at least min_time seconds,
+    shorter runs are dominated by timer noise
+    """
+    regressions = []
+    for key, expected in baseline.items():
+        if key not in summary:
+            continue
+        current = summary[key]
+
+        if current['failures']:
+            total = current['failures'] + current['samples']
+            regressions.append(f"{key}: {current['failures']} of {total} runs failed")
+        if not current['samples'] or not expected.get('samples'):
+            continue
+
+        if current['best_mean'] > expected['best_mean'] * (1 + tolerance):
+            regressions.append(f"{key}: mean best {current['best_mean']:.2f} > baseline {expected['best_mean']:.2f}")
+
+        if min(current['time_mean'], expected['time_mean']) >= min_time:
+            for rate in ['evaluation_rate', 'delta_rate']:
+                if current[rate] < expected[rate] * (1 - time_tolerance):
+                    regressions.append(f"{key}: {rate.replace('_', ' ')} {current[rate]:.0f}/s < "
+                                       f"baseline {expected[rate]:.0f}/s")
+
+        if expected.get('target_reached') is None or current.get('target_reached') is None:
+            continue
+        if current['target_reached'] < expected['target_reached']:
+            regressions.append(f"{key}: target reached in {current['target_reached']:.0%} of runs < "
+                               f"baseline {expected['target_reached']:.0%}")
+        elif current['evaluations_to_target_mean'] is not None and expected['evaluations_to_target_mean'] is not None \
+                and current['evaluations_to_target_mean'] > expected['evaluations_to_target_mean'] * (1 + tolerance):
+            regressions.append(f"{key}: evaluations to target {current['evaluations_to_target_mean']:.0f} > "
+                               f"baseline {expected['evaluations_to_target_mean']:.0f}")
+    return regressions
+
+
+def failed_run(task, error):
+    solver, options, instance, popsize, sample, seed, time_limit, evaluations, target = task
+    return {
+        'solver': solver,
+        'instance': instance,
+        'sample': sample,
+        'seed': seed,
+        'options': options,
+        'error': f"{type(error).__name__}: {error}",
+    }
+
+
+def run_tasks(tasks, workers=None):
+    """
+    results of all tasks, task that raised is recorded as run with 'error' instead of losing the others
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(task, executor.submit(run_task, task)) for task in tasks]
+
+        runs = []
+        for task, future in futures:
+            try:
+                runs.append(future.result())
+            except Exception as e:
+                runs.append(failed_run(task, e))
+        return runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--solvers", nargs='+', default=list(SOLVERS.keys()), choices=SOLVERS.keys())
+    parser.add_argument("--instances", nargs='+', default=['cities'], help=".tsp files or 'cities'")
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0, help="base seed from which seeds of all samples are derived")
+    parser.add_argument("--popsize", type=int, default=20)
+    parser.add_argument("--time-limit", type=float, default=None, help="seconds per run")
+    parser.add_argument("--evaluations", type=int, default=None, help="evaluated tours per run")
+    parser.add_argument("--targets", type=json.loads, default={},
+                        help='JSON with target tour length of instances, e.g. \'{"cities": 900}\'')
+    parser.add_argument("--options", type=json.loads, default={},
+                        help='JSON with options overrides, e.g. \'{"ant": {"lockstep": true}}\'')
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--baseline", type=argparse.FileType('r'), help="fail when results are worse than baseline")
+    parser.add_argument("--tolerance", type=float, default=0.02,
+                        help="allowed relative degradation of mean best and evaluations to target")
+    parser.add_argument("--time-tolerance", type=float, default=0.2,
+                        help="allowed relative degradation of evaluation and delta rates")
+    parser.add_argument("--min-time", type=float, default=1.0,
+                        help="mean run time in seconds below which rates are reported but not compared")
+    parser.add_argument("--save-baseline", type=argparse.FileType('w'))
+    parser.add_argument("-o", "--output", type=argparse.FileType('w'), default=sys.stdout)
+
+    args = parser.parse_args()
+
+    tasks = build_tasks(
+        args.solvers, args.instances, args.samples, args.seed, args.popsize,
+        args.options, args.time_limit, args.evaluations, args.targets
+    )
+
+    start = timer()
+    runs = run_tasks(tasks, args.workers)
+    summary = summarize(runs)
+    print(f"finished in {timer() - start:.2f}s", file=sys.stderr)
+    for run in runs:
+        if 'error' in run:
+            print(f"{run['solver']}:{run['instance']} sample {run['sample']} failed: {run['error']}", file=sys.stderr)
+
+    json.dump({'summary': summary, 'runs': runs}, args.output, indent=1)
+
+    if args.save_baseline:
+        json.dump(summary, args.save_baseline, indent=1)
+
+    if args.baseline:
+        regressions = compare(summary, json.load(args.baseline), args.tolerance, args.time_tolerance,
+                              args.min_time)
+        for regression in regressions:
+            print(f"regression {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
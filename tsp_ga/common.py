@@ -1,7 +1,81 @@
-import math
-
 import numpy as np
 
+# rows of the distance matrix computed at once, bounds temporary memory of large instances
+CHUNK = 1024
+
+# bytes of temporary arrays while scanning rows of the distance matrix for nearest cities
+MEMORY_BUDGET = 64 * 2**20
+
+# TSPLIB GEO uses these constants instead of exact ones, optimal tour lengths are published with them
+GEO_PI = 3.141592
+GEO_RADIUS = 6378.388
+
+
+def euclidean(a, b):
+    diff = a - b
+    return np.sqrt(np.add.reduce(diff * diff, axis=-1))
+
+
+def euclidean_rounded(a, b):
+    """
+    TSPLIB EUC_2D, euclidean distance rounded to nearest integer
+    """
+    return np.floor(euclidean(a, b) + 0.5)
+
+
+def euclidean_ceil(a, b):
+    return np.ceil(euclidean(a, b))
+
+
+def geo(a, b):
+    """
+    TSPLIB GEO, coordinates are latitude and longitude in DDD.MM format
+    """
+    def radians(x):
+        degrees = np.trunc(x)
+        return GEO_PI * (degrees + 5.0 * (x - degrees) / 3.0) / 180.0
+
+    a = radians(a)
+    b = radians(b)
+    q1 = np.cos(a[..., 1] - b[..., 1])
+    q2 = np.cos(a[..., 0] - b[..., 0])
+    q3 = np.cos(a[..., 0] + b[..., 0])
+    distance = np.trunc(GEO_RADIUS * np.arccos(np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)) + 1)
+    return np.where((a == b).all(axis=-1), 0, distance)
+
+
+METRICS = {
+    'EXACT': euclidean,
+    'EUC_2D': euclidean_rounded,
+    'CEIL_2D': euclidean_ceil,
+    'GEO': geo,
+}
+
+
+class LazyDistances:
+    """
+    Distance matrix computed on demand from coordinates, for instances too big for dense N x N matrix.
+    Supports the same indexing as the dense matrix: distances[a, b] with scalars or index arrays and distances[a].
+    """
+
+    def __init__(self, coords, metric):
+        self.coords = coords
+        self.metric = metric
+
+    @property
+    def shape(self):
+        return len(self.coords), len(self.coords)
+
+    def __len__(self):
+        return len(self.coords)
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            rows, cols = index
+            return self.metric(self.coords[rows], self.coords[cols])
+
+        return self.metric(self.coords[index], self.coords)
+
 
 class Trajectory:
     def __init__(self, path, distance):
@@ -12,24 +86,226 @@ class Trajectory:
         return f"({self.distance}) {self.path}"
 
 
+class GenerationReport(Trajectory):
+    """
+    best tour of a generation together with statistics of all tours evaluated in it
+    """
+
+    def __init__(self, path, distance, generation, evaluations, mean, worst):
+        super().__init__(path, distance)
+        self.generation = generation
+        self.evaluations = evaluations
+        self.mean = mean
+        self.worst = worst
+
+    @classmethod
+    def of(cls, trajectories, generation, evaluations):
+        distances = np.array([trajectory.distance for trajectory in trajectories])
+        best = trajectories[int(np.argmin(distances))]
+        return cls(best.path, best.distance, generation, evaluations, float(distances.mean()), float(distances.max()))
+
+
+# reporting granularity of solvers, 'tour', 'generation', 'improvement' or int K for every K generations
+REPORTS = ('tour', 'generation', 'improvement')
+
+
+def check_report(report):
+    if report not in REPORTS and not (isinstance(report, int) and report > 0):
+        raise ValueError(f"Unknown report '{report}', use one of {REPORTS} or number of generations")
+
+
+def should_report(report, generation, improved):
+    """
+    whether generation-level report is due after finished generation
+    """
+    if report == 'tour':
+        return False
+    if report == 'generation':
+        return True
+    if report == 'improvement':
+        return improved
+    return generation % report == 0
+
+
 class Evaluator:
-    def __init__(self, cities):
-        self.hops = len(cities)
-        self.distances = np.ndarray((len(cities), len(cities)))
-        for city1 in cities:
-            for city2 in cities:
-                x = abs(city1.x - city2.x)
-                y = abs(city1.y - city2.y)
-                self.distances[city1.id, city2.id] = math.sqrt(x * x + y * y)
+    def __init__(self, cities=None, metric='EXACT', dense=True, dtype=np.float64, distances=None):
+        """
+        cities are City namedtuples indexed by their id or (N, 2) array of coordinates,
+        explicit distance matrix can be passed instead of them.
+        Without dense matrix the distances are computed on the fly from coordinates.
+        """
+        # number of evaluated tours
+        self.evaluations = 0
+        # number of moves priced by delta, including moves tried by local search
+        self.deltas = 0
+
+        if distances is not None:
+            self.coords = None
+            self.distances = np.asarray(distances, dtype=dtype)
+            self.hops = len(self.distances)
+            return
+
+        if isinstance(cities, np.ndarray):
+            coords = cities.astype(np.float64)
+        else:
+            coords = np.ndarray((len(cities), 2))
+            for city in cities:
+                coords[city.id] = city.x, city.y
+
+        self.coords = coords
+        self.hops = len(coords)
+        self.metric = METRICS[metric]
+
+        if dense:
+            self.distances = np.empty((self.hops, self.hops), dtype=dtype)
+            for start in range(0, self.hops, CHUNK):
+                rows = coords[start:start + CHUNK]
+                self.distances[start:start + CHUNK] = self.metric(rows[:, np.newaxis], coords[np.newaxis])
+        else:
+            self.distances = LazyDistances(coords, self.metric)
+
+    def __len__(self):
+        return self.hops
 
     def cost(self, trajectory):
         if len(trajectory) != self.hops:
             raise ValueError(f"Trajectory must be composed from {self.hops} hops")
 
-        total = 0
-        prev = trajectory[-1]
-        for city in trajectory:
-            total += self.distances[prev, city]
-            prev = city
+        self.evaluations += 1
+        trajectory = np.asarray(trajectory)
+        return np.add.reduce(self.distances[np.roll(trajectory, 1), trajectory])
+
+    def cost_many(self, trajectories):
+        """
+        cost of (P, N) array of trajectories
+        """
+        trajectories = np.asarray(trajectories)
+        if trajectories.shape[1] != self.hops:
+            raise ValueError(f"Trajectory must be composed from {self.hops} hops")
+
+        self.evaluations += len(trajectories)
+        return np.add.reduce(self.distances[np.roll(trajectories, 1, axis=1), trajectories], axis=1)
+
+    def nearest(self, k):
+        """
+        (N, k) array of k nearest cities of each city sorted by distance, city itself is excluded
+        """
+        k = min(k, self.hops - 1)
+        if k <= 0:
+            return np.empty((self.hops, 0), dtype=int)
+
+        # euclidean metrics are monotone in distance of coordinates, so spatial index finds the same cities
+        if self.coords is not None and self.metric is not geo:
+            nearest = self.nearest_tree(k)
+            if nearest is not None:
+                return nearest
+        return self.nearest_scan(k)
+
+    def nearest_tree(self, k):
+        """
+        nearest cities from k-d tree of coordinates in O(N log N), None when scipy is not available
+        """
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            return None
+
+        _, candidates = cKDTree(self.coords).query(self.coords, k + 1)
+        rows = np.arange(self.hops)
+        is_self = candidates == rows[:, np.newaxis]
+        # duplicates of the city may push the city itself out of its candidates, drop the farthest one then
+        is_self[~is_self.any(axis=1), -1] = True
+        candidates = candidates[~is_self].reshape(self.hops, k)
+
+        distances = self.metric(self.coords[rows[:, np.newaxis]], self.coords[candidates])
+        return np.take_along_axis(candidates, np.lexsort((candidates, distances)), axis=1)
+
+    def nearest_scan(self, k):
+        """
+        nearest cities by scanning rows of the distance matrix, rows per chunk are limited by MEMORY_BUDGET
+        """
+        # lazy distances need about 8 float64 temporaries per pair of cities, dense matrix about 2
+        per_pair = 64 if isinstance(self.distances, LazyDistances) else 16
+        chunk = max(1, MEMORY_BUDGET // (self.hops * per_pair))
+
+        nearest = np.empty((self.hops, k), dtype=int)
+        cities = np.arange(self.hops)
+        for start in range(0, self.hops, chunk):
+            rows = cities[start:start + chunk]
+            distances = np.array(self.distances[rows[:, np.newaxis], cities[np.newaxis]], dtype=np.float64)
+            distances[np.arange(len(rows)), rows] = np.inf
+
+            candidates = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            distances = np.take_along_axis(distances, candidates, axis=1)
+            nearest[rows] = np.take_along_axis(candidates, np.lexsort((candidates, distances)), axis=1)
+
+        return nearest
+
+    # O(1) cost deltas of local moves, tour is cyclic and positions are indices into it
+
+    def swap_delta(self, trajectory, i, j):
+        """
+        cost change after swapping cities on positions i and j
+        """
+        self.deltas += 1
+        n = len(trajectory)
+        if i == j:
+            return 0
+
+        def city(k):
+            k %= n
+            if k == i:
+                return trajectory[j]
+            if k == j:
+                return trajectory[i]
+            return trajectory[k]
+
+        # edge k connects positions k and k + 1
+        edges = {(i - 1) % n, i, (j - 1) % n, j}
+        before = sum(self.distances[trajectory[k], trajectory[(k + 1) % n]] for k in edges)
+        after = sum(self.distances[city(k), city(k + 1)] for k in edges)
+        return after - before
+
+    def two_opt_delta(self, trajectory, i, j):
+        """
+        cost change after reversing segment on positions i+1..j, the segment may wrap around the end
+        """
+        self.deltas += 1
+        n = len(trajectory)
+        a, b = trajectory[i], trajectory[(i + 1) % n]
+        c, d = trajectory[j], trajectory[(j + 1) % n]
+        return self.distances[a, c] + self.distances[b, d] - self.distances[a, b] - self.distances[c, d]
+
+    def or_opt_delta(self, trajectory, i, length, j, reverse=False):
+        """
+        cost change after moving segment on positions i..i+length-1 between positions j and j+1,
+        reversed when reverse is set, j must lie outside of the segment and must not be its predecessor
+        """
+        self.deltas += 1
+        n = len(trajectory)
+        prev, first = trajectory[i - 1], trajectory[i]
+        last, after = trajectory[(i + length - 1) % n], trajectory[(i + length) % n]
+        a, b = trajectory[j], trajectory[(j + 1) % n]
+        if reverse:
+            added = self.distances[a, last] + self.distances[first, b]
+        else:
+            added = self.distances[a, first] + self.distances[last, b]
+
+        return self.distances[prev, after] + added \
+            - self.distances[prev, first] - self.distances[last, after] - self.distances[a, b]
+
+
+def make_evaluator(cities):
+    """
+    evaluator of cities given as Evaluator, tsplib Instance, list of City namedtuples or array of coordinates
+    """
+    if isinstance(cities, Evaluator):
+        return cities
+    if hasattr(cities, 'evaluator'):
+        return cities.evaluator()
+    return Evaluator(cities)
+
 
-        return total
\ No newline at end of file
+def swap(trajectory, i, j):
+    trajectory[i], trajectory[j] = trajectory[j], trajectory[i]
+    return trajectory
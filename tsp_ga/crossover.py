@@ -0,0 +1,89 @@
+import random
+
+import numpy as np
+
+
+def cut_points(n):
+    left = random.randint(0, n - 1)
+    right = random.randint(left + 1, n)
+    return left, right
+
+
+def order_crossover(a, b):
+    """
+    OX: keep a[:left + 1] and a[right:], fill the middle with remaining cities in order of b
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    left, right = cut_points(len(a))
+
+    used = np.zeros(len(a), dtype=bool)
+    used[a[:left + 1]] = True
+    used[a[right:]] = True
+
+    new = a.copy()
+    new[left + 1:right] = b[~used[b]]
+    return new.tolist()
+
+
+def partially_mapped_crossover(a, b):
+    """
+    PMX: take segment from a and place it into b by swapping, position index keeps it O(N)
+    """
+    new = np.array(b)
+    left, right = cut_points(len(a))
+
+    pos = np.empty(len(new), dtype=int)
+    pos[new] = np.arange(len(new))
+
+    for i in range(left, right):
+        j = pos[a[i]]
+        new[i], new[j] = new[j], new[i]
+        pos[new[i]] = i
+        pos[new[j]] = j
+
+    return new.tolist()
+
+
+def edge_recombination_crossover(a, b):
+    """
+    ERX: build child from union of edges of both parents,
+    next city is the neighbour with fewest remaining neighbours
+    """
+    n = len(a)
+    edges = [set() for _ in range(n)]
+    for parent in (list(a), list(b)):
+        for prev, city in zip(parent[-1:] + parent[:-1], parent):
+            edges[prev].add(city)
+            edges[city].add(prev)
+
+    visited = np.zeros(n, dtype=bool)
+    # fallback order when current city has no remaining neighbour
+    unvisited = list(range(n))
+    random.shuffle(unvisited)
+
+    city = a[0]
+    new = []
+    while True:
+        new.append(city)
+        visited[city] = True
+        for neighbour in edges[city]:
+            edges[neighbour].discard(city)
+
+        if len(new) == n:
+            return new
+
+        if edges[city]:
+            fewest = min(len(edges[c]) for c in edges[city])
+            city = random.choice([c for c in edges[city] if len(edges[c]) == fewest])
+        else:
+            while visited[unvisited[-1]]:
+                unvisited.pop()
+            city = unvisited[-1]
+
+
+OPERATORS = {
+    'ox': order_crossover,
+    'pmx': partially_mapped_crossover,
+    'erx': edge_recombination_crossover,
+}
@@ -3,40 +3,46 @@ import random
 
 import numpy as np
 
-from common import Trajectory, Evaluator
+from common import Trajectory, Evaluator, GenerationReport, check_report, make_evaluator, should_report, swap
+from crossover import OPERATORS, order_crossover
+from local_search import LocalSearch
+from selection import METHODS, select_parents, select_survivors
 
 
 class Genetic:
+    defaults = {
+        'crossover': 'ox',
+        'selection': 'roulette',
+        'tournament_size': 2,
+        'local_search': False,
+        'neighbours': 10,
+        # probability that child is made by crossover, otherwise it is mutated copy of its first parent
+        'crossover_rate': 1.0,
+        # yield after every 'tour', 'generation', every K generations or only on 'improvement'
+        'report': 'generation',
+    }
+
     def __init__(self, cities, popsize):
-        self.evaluator = Evaluator(cities)
-        self.cities = [(city.x, city.y) for city in cities]
+        self.evaluator = make_evaluator(cities)
         self.popsize = popsize
+        # number of finished generations
+        self.generation = 0
+        # tours received from other populations, they join the next generation
+        self.immigrants = []
 
-    def select(self, population):
-        distances = [trajectory.distance for trajectory in population]
-        m = min(distances)
-        M = max(distances)
-
-        costs = sorted([(1 - (trajectory.distance - m) / (M - m+0.0001), i, trajectory.distance) for i, trajectory in enumerate(population)], key=lambda x: x[0])
-
-        first = None
-        r = np.random.uniform()
-        for x in costs:
-            if x[0] >= r:
-                first = x[1]
-                costs.remove(x)
-                break
-
-        r = np.random.uniform()
-        for x in costs:
-            if x[0] >= r:
-                return first, x[1]
+    def run(self, opts):
+        for key in opts.keys():
+            if key not in self.defaults:
+                raise KeyError(f"Unknown parameter '{key}'")
+        opts = {**self.defaults, **opts}
+        check_report(opts['report'])
 
-        return first, costs[-1][1]
+        crossover = OPERATORS[opts['crossover']]
+        selection = METHODS[opts['selection']]
+        local_search = LocalSearch(self.evaluator, opts['neighbours']) if opts['local_search'] else None
 
-    def run(self, opts):
         def make_trajectory():
-            trajectory = list(range(len(self.cities)))
+            trajectory = list(range(self.evaluator.hops))
             random.shuffle(trajectory)
 
             return Trajectory(trajectory, self.evaluator.cost(trajectory))
@@ -45,20 +51,12 @@ class Genetic:
 
         glob_best = None
         not_changed = 0
+        reported = True
         while not_changed < 5000:
+            population += self.immigrants
+            self.immigrants = []
             intermediate = population.copy()
 
-            for i in range(self.popsize):
-                first, second = self.select(population)
-                parent1 = population[first].path
-                parent2 = population[second].path
-
-                new = self.merge(parent1, parent2)
-                new = self.mutate(new)
-                new = Trajectory(new, self.evaluator.cost(new))
-
-                intermediate.append(new)
-
             changed = False
             for trajectory in population:
                 if glob_best is None or trajectory.distance < glob_best.distance:
@@ -68,50 +66,60 @@ class Genetic:
             if not changed:
                 not_changed += 1
 
-                yield (glob_best, new)
-
-            population = sorted(intermediate, key=lambda x: x.distance)[0:self.popsize]
-
-    def mutate(self, cities):
-        cities = cities.copy()
-        a, b = self.rand_two()
-
-        cities[a], cities[b] = cities[b], cities[a]
-        return cities
+            costs = np.array([trajectory.distance for trajectory in population])
+            parents = select_parents(selection, costs, self.popsize, tournament_size=opts['tournament_size'])
+
+            children = []
+            distances = []
+            crossed = []
+            for first, second in parents:
+                if random.random() < opts['crossover_rate']:
+                    crossed.append(len(children))
+                    children.append(crossover(population[first].path, population[second].path))
+                    distances.append(None)
+                else:
+                    # copy of the parent keeps its cached distance and needs no full evaluation
+                    children.append(population[first].path)
+                    distances.append(population[first].distance)
+
+            # evaluate all crossed children at once
+            if crossed:
+                for i, distance in zip(crossed, self.evaluator.cost_many([children[i] for i in crossed])):
+                    distances[i] = distance
+
+            # mutation is scored by delta from the cached distance
+            for path, distance in zip(children, distances):
+                path, distance = self.mutate(path, distance)
+                if local_search:
+                    path, distance = local_search.improve(path, distance)
+                new = Trajectory(path, distance)
+                intermediate.append(new)
 
-    def rand_two(self):
-        to_choose = list(range(0, len(self.cities)))
-        a = random.choice(to_choose)
-        to_choose.remove(a)
-        b = random.choice(to_choose)
-        return a, b
+                if opts['report'] == 'tour':
+                    yield glob_best, new
 
-    def merge(self, a, b):
-        left = random.randint(0, len(self.cities) - 1)
-        right = random.randint(left + 1, len(self.cities))
+            report = GenerationReport.of(intermediate[len(population):], self.generation, self.evaluator.evaluations)
 
-        new = [None for i in range(len(a))]
+            costs = np.array([trajectory.distance for trajectory in intermediate])
+            population = [intermediate[i] for i in select_survivors(costs, self.popsize)]
+            self.generation += 1
 
-        for i in range(left + 1):
-            new[i] = a[i]
+            reported = should_report(opts['report'], self.generation, changed)
+            if reported:
+                yield glob_best, report
 
-        for i in range(right, len(a)):
-            new[i] = a[i]
+        if not reported and opts['report'] != 'tour':
+            # last generation is always reported
+            yield glob_best, report
 
-        j = 0
-        i = left + 1
-        while i < right:
-            while True:
-                if b[j] not in new:
+    def mutate(self, cities, distance):
+        a, b = self.rand_two()
 
-                    if new[i]:
-                        raise "xxx"
-                    new[i] = b[j]
-                    break
-                j += 1
-            i += 1
+        distance += self.evaluator.swap_delta(cities, a, b)
+        return swap(cities.copy(), a, b), distance
 
-        return new
+    def rand_two(self):
+        return random.sample(range(self.evaluator.hops), 2)
 
 
 class Geneticx:
@@ -144,33 +152,8 @@ class Geneticx:
                 population = new
 
     def merge(self, a, b):
-        left = random.randint(0, len(self.cities) - 1)
-        right = random.randint(left + 1, len(self.cities))
-
-
-        new = [None for i in range(len(a))]
-
-        for i in range(left + 1):
-            new[i] = a[i]
-
-        for i in range(right, len(a)):
-            new[i] = a[i]
-
-        j = 0
-        i = left + 1
-        while i < right:
-            while True:
-                if b[j] not in new:
-
-                    if new[i]:
-                        raise "xxx"
-                    new[i] = b[j]
-                    break
-                j += 1
-            i += 1
-
-        return new
-
+        new = order_crossover([city.id for city in a], [city.id for city in b])
+        return [self.cities[i] for i in new]
 
     def mutate(self, cities):
         cities = cities.copy()
@@ -180,8 +163,4 @@ class Geneticx:
         return cities
 
     def rand_two(self):
-        to_choose = list(range(0, len(self.cities)))
-        a = random.choice(to_choose)
-        to_choose.remove(a)
-        b = random.choice(to_choose)
-        return a, b
\ No newline at end of file
+        return random.sample(range(self.evaluator.hops), 2)
\ No newline at end of file
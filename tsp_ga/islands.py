@@ -0,0 +1,149 @@
+import multiprocessing
+import queue
+import random
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from common import Trajectory
+
+# seconds between checks whether islands are still alive
+POLL = 0.5
+
+
+def run_island(k, clazz, cities, popsize, opts, seed, islands, interval, epochs, barrier, results, tours_name, distances_name):
+    """
+    run single colony/population in its own process, every interval generations publish its best tour
+    into shared memory and take the best tour of the previous island in the ring as immigrant
+    """
+    try:
+        evolve_island(k, clazz, cities, popsize, opts, seed, islands, interval, epochs, barrier, results,
+                      tours_name, distances_name)
+    except Exception:
+        # do not leave the other islands waiting for this one
+        barrier.abort()
+        raise
+
+
+def evolve_island(k, clazz, cities, popsize, opts, seed, islands, interval, epochs, barrier, results, tours_name, distances_name):
+    random.seed(seed)
+    np.random.seed(seed)
+
+    tours_shm = shared_memory.SharedMemory(name=tours_name)
+    distances_shm = shared_memory.SharedMemory(name=distances_name)
+    tours = np.ndarray((islands, len(cities)), dtype=np.int64, buffer=tours_shm.buf)
+    distances = np.ndarray(islands, dtype=np.float64, buffer=distances_shm.buf)
+
+    solver = clazz(cities, popsize)
+    # migration happens between generations, tours need not be reported one by one
+    steps = solver.run({'report': 'generation', **opts})
+    best = None
+
+    try:
+        for epoch in range(epochs):
+            target = solver.generation + interval
+            while solver.generation < target:
+                try:
+                    best, _ = next(steps)
+                except StopIteration:
+                    break
+
+            tours[k] = best.path
+            distances[k] = best.distance
+            results.put((list(best.path), float(best.distance)))
+            barrier.wait()
+
+            source = (k - 1) % islands
+            solver.immigrants.append(Trajectory(tours[source].tolist(), float(distances[source])))
+            barrier.wait()
+    except threading.BrokenBarrierError:
+        # driver was stopped or another island died
+        pass
+    finally:
+        del tours, distances
+        tours_shm.close()
+        distances_shm.close()
+
+
+def receive(results, processes):
+    """
+    next epoch result of any island, raises when some island died instead of waiting forever
+    """
+    while True:
+        try:
+            return results.get(timeout=POLL)
+        except queue.Empty:
+            for k, process in enumerate(processes):
+                if process.exitcode is not None and process.exitcode != 0:
+                    raise RuntimeError(f"Island {k} died with exit code {process.exitcode}")
+
+
+class IslandModel:
+    """
+    Runs independent colonies or populations of solver in separate processes,
+    best tours migrate between neighbouring islands in ring every `interval` generations.
+    """
+
+    defaults = {
+        'islands': multiprocessing.cpu_count(),
+        'interval': 10,
+        'epochs': 10,
+        'seed': None,
+    }
+
+    def __init__(self, solver, cities, popsize):
+        self.solver = solver
+        self.cities = cities
+        self.popsize = popsize
+
+    def run(self, opts):
+        island_opts = {key: val for key, val in opts.items() if key not in self.defaults}
+        opts = {**self.defaults, **{key: val for key, val in opts.items() if key in self.defaults}}
+
+        islands = opts['islands']
+        N = len(self.cities)
+        seed = opts['seed'] if opts['seed'] is not None else random.randint(0, 2**31)
+        seeds = np.random.SeedSequence(seed).generate_state(islands)
+
+        tours_shm = shared_memory.SharedMemory(create=True, size=islands * N * np.dtype(np.int64).itemsize)
+        distances_shm = shared_memory.SharedMemory(create=True, size=islands * np.dtype(np.float64).itemsize)
+
+        # islands meet on the barrier after every epoch and send their best tours to this driver
+        barrier = multiprocessing.Barrier(islands)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=run_island, args=(
+                k, self.solver, self.cities, self.popsize, island_opts, int(seeds[k]),
+                islands, opts['interval'], opts['epochs'], barrier, results, tours_shm.name, distances_shm.name
+            ))
+            for k in range(islands)
+        ]
+
+        try:
+            for process in processes:
+                process.start()
+
+            best = None
+            for epoch in range(opts['epochs']):
+                path, distance = min((receive(results, processes) for _ in range(islands)), key=lambda r: r[1])
+                current = Trajectory(path, distance)
+
+                if best is None or current.distance < best.distance:
+                    best = current
+                yield best, current
+        finally:
+            barrier.abort()
+            for process in processes:
+                # island cannot exit until its queued results are consumed
+                while process.is_alive():
+                    try:
+                        results.get(timeout=POLL)
+                    except queue.Empty:
+                        pass
+                    process.join(POLL)
+
+            tours_shm.close()
+            tours_shm.unlink()
+            distances_shm.close()
+            distances_shm.unlink()
@@ -0,0 +1,150 @@
+from collections import deque
+
+import numpy as np
+
+EPSILON = 1e-10
+
+
+class LocalSearch:
+    """
+    2-opt and Or-opt improvement restricted to k nearest neighbours of each city.
+    Cities whose neighbourhood did not improve the tour are skipped (don't-look bits)
+    until one of their edges changes.
+    """
+
+    def __init__(self, evaluator, neighbours=10, max_segment=3):
+        self.evaluator = evaluator
+        self.distances = evaluator.distances
+        self.max_segment = max_segment
+
+        # candidate lists sorted by distance
+        self.neighbours = evaluator.nearest(neighbours).tolist()
+
+    def improve(self, trajectory, distance):
+        """
+        improve trajectory until no improving move is found, returns new trajectory and its distance
+        """
+        self.tour = np.array(trajectory)
+        self.n = len(self.tour)
+        if self.n < 5:
+            return list(trajectory), distance
+
+        self.pos = np.empty(self.n, dtype=int)
+        self.pos[self.tour] = np.arange(self.n)
+
+        queue = deque(self.tour.tolist())
+        active = np.ones(self.n, dtype=bool)
+
+        while queue:
+            city = queue.popleft()
+            active[city] = False
+
+            changed = self.two_opt(city) or self.or_opt(city)
+            if changed:
+                delta, touched = changed
+                distance += delta
+                for c in touched:
+                    if not active[c]:
+                        active[c] = True
+                        queue.append(c)
+
+        return self.tour.tolist(), distance
+
+    def succ(self, city):
+        return self.tour[(self.pos[city] + 1) % self.n]
+
+    def pred(self, city):
+        return self.tour[self.pos[city] - 1]
+
+    def two_opt(self, a):
+        d = self.distances
+
+        for forward in (True, False):
+            b = self.succ(a) if forward else self.pred(a)
+            for c in self.neighbours[a]:
+                # neighbours are sorted, so no further candidate can shorten the tour
+                if d[a, c] >= d[a, b]:
+                    break
+
+                e = self.succ(c) if forward else self.pred(c)
+                if c == b or e == a:
+                    continue
+
+                if forward:
+                    # a b ... c e
+                    delta = self.evaluator.two_opt_delta(self.tour, self.pos[a], self.pos[c])
+                else:
+                    # e c ... b a
+                    delta = self.evaluator.two_opt_delta(self.tour, self.pos[e], self.pos[b])
+                if delta < -EPSILON:
+                    if forward:
+                        # a b ... c e -> a c ... b e
+                        self.reverse(self.pos[b], self.pos[c])
+                    else:
+                        # e c ... b a -> e b ... c a
+                        self.reverse(self.pos[c], self.pos[b])
+                    return delta, (a, b, c, e)
+
+        return None
+
+    def or_opt(self, first):
+        for length in range(1, min(self.max_segment, self.n - 3) + 1):
+            start = self.pos[first]
+            last = self.tour[(start + length - 1) % self.n]
+            p = self.pred(first)
+            nx = self.succ(last)
+
+            def in_segment(city):
+                return (self.pos[city] - start) % self.n < length
+
+            for c in self.neighbours[first]:
+                if in_segment(c):
+                    continue
+
+                # first next to c, segment either after c or reversed before c
+                for a, b, reverse in ((c, self.succ(c), False), (self.pred(c), c, True)):
+                    if in_segment(a) or in_segment(b):
+                        continue
+
+                    delta = self.evaluator.or_opt_delta(self.tour, start, length, self.pos[a], reverse)
+                    if delta < -EPSILON:
+                        self.move_segment(start, length, a, reverse)
+                        return delta, (p, nx, first, last, a, b)
+
+        return None
+
+    def reverse(self, i, j):
+        """
+        reverse cyclic segment from position i to position j, or its complement when that is shorter,
+        both give the same cycle
+        """
+        length = (j - i) % self.n + 1
+        if 2 * length > self.n:
+            i, length = j + 1, self.n - length
+
+        idx = (i + np.arange(length)) % self.n
+        cities = self.tour[idx][::-1]
+        self.tour[idx] = cities
+        self.pos[cities] = idx
+
+    def move_segment(self, start, length, a, reverse):
+        """
+        move segment of length cities starting on position start after city a,
+        only cities between the old and the new place of the segment are shifted
+        """
+        segment = self.tour[(start + np.arange(length)) % self.n]
+        if reverse:
+            segment = segment[::-1]
+
+        # cities after the segment up to a, or after a up to the segment
+        after = (self.pos[a] - start - length) % self.n + 1
+        before = self.n - length - after
+        if after <= before:
+            idx = (start + np.arange(after + length)) % self.n
+            cities = np.concatenate([self.tour[idx[length:]], segment])
+        else:
+            idx = (self.pos[a] + 1 + np.arange(before + length)) % self.n
+            cities = np.concatenate([segment, self.tour[idx[:before]]])
+
+        self.tour[idx] = cities
+        self.pos[cities] = idx
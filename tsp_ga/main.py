@@ -10,6 +10,8 @@ from antcolony import AntColony
 from cities import cities
 from genetic import Genetic
 from common import Trajectory
+from islands import IslandModel
+from functools import partial
 
 np.set_printoptions(threshold=np.nan, linewidth=10000)
 
@@ -46,6 +48,8 @@ class MainWindow(QMainWindow):
         self.ui.popSize.setValue(20)
         self.ui.algorithm.addItem('ant', AntColony)
         self.ui.algorithm.addItem('genetic', Genetic)
+        self.ui.algorithm.addItem('ant islands', partial(IslandModel, AntColony))
+        self.ui.algorithm.addItem('genetic islands', partial(IslandModel, Genetic))
         self.ui.algorithm.addItem('solver', Test)
 
         self.ui.playBtn.clicked.connect(self.on_play_click)
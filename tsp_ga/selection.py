@@ -0,0 +1,79 @@
+import numpy as np
+
+
+def fitness(costs):
+    m = np.min(costs)
+    M = np.max(costs)
+    return 1 - (costs - m) / (M - m + 0.0001)
+
+
+def roulette(costs, count, **kwargs):
+    """
+    fitness proportionate selection, cumulative distribution is built once for all draws
+    """
+    cdf = np.cumsum(fitness(costs))
+    cdf /= cdf[-1]
+    chosen = np.searchsorted(cdf, np.random.uniform(size=count), side='right')
+    return np.minimum(chosen, len(costs) - 1)
+
+
+def stochastic_universal_sampling(costs, count, **kwargs):
+    """
+    roulette with count equally spaced pointers and single random offset
+    """
+    cdf = np.cumsum(fitness(costs))
+    cdf /= cdf[-1]
+    pointers = (np.random.uniform() + np.arange(count)) / count
+    chosen = np.minimum(np.searchsorted(cdf, pointers, side='right'), len(costs) - 1)
+    np.random.shuffle(chosen)
+    return chosen
+
+
+def tournament(costs, count, tournament_size=2, **kwargs):
+    """
+    best of tournament_size distinct units, taken as the smallest of random keys of each row
+    """
+    size = min(tournament_size, len(costs))
+    candidates = np.argpartition(np.random.uniform(size=(count, len(costs))), size - 1, axis=1)[:, :size]
+    return candidates[np.arange(count), np.argmin(costs[candidates], axis=1)]
+
+
+METHODS = {
+    'roulette': roulette,
+    'sus': stochastic_universal_sampling,
+    'tournament': tournament,
+}
+
+
+def select_parents(method, costs, count, **kwargs):
+    """
+    draw count pairs of parents at once, returns (count, 2) array of indices
+    """
+    costs = np.asarray(costs)
+    pairs = method(costs, 2 * count, **kwargs).reshape(count, 2)
+
+    if len(costs) < 2:
+        return pairs
+
+    # redraw second parent when both parents are the same
+    for _ in range(10):
+        same = pairs[:, 0] == pairs[:, 1]
+        if not same.any():
+            return pairs
+        pairs[same, 1] = method(costs, np.count_nonzero(same), **kwargs)
+
+    # method keeps choosing the same unit, pair it with uniformly chosen other one
+    same = pairs[:, 0] == pairs[:, 1]
+    pairs[same, 1] = (pairs[same, 0] + np.random.randint(1, len(costs), size=np.count_nonzero(same))) % len(costs)
+    return pairs
+
+
+def select_survivors(costs, count):
+    """
+    indices of count best units, without sorting the whole population
+    """
+    costs = np.asarray(costs)
+    if count >= len(costs):
+        return np.arange(len(costs))
+
+    return np.argpartition(costs, count - 1)[:count]
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+import numpy as np
+
+from antcolony import AntColony
+from common import Trajectory
+
+
+class TestAntColony(TestCase):
+    def check_permutation(self, colony):
+        n = len(colony.evaluator)
+        for candidates in [0, 1, 3]:
+            for lockstep in [False, True]:
+                options = {'candidates': candidates, 'lockstep': lockstep, 'max_generations': 3}
+                for best, tour in colony.run(options):
+                    self.assertEqual(list(range(n)), sorted(tour.path))
+
+    def test_permutation(self):
+        for n in [2, 5, 20]:
+            # duplicate cities leave ants without attractive city, so fallback is exercised too
+            for coords in [np.random.rand(n, 2) * 100, np.random.randint(0, 2, (n, 2))]:
+                self.check_permutation(AntColony(coords, n))
+
+    def test_unknown_deposit(self):
+        colony = AntColony(np.random.rand(5, 2), 5)
+        with self.assertRaises(ValueError):
+            next(colony.run({'deposit': 'best'}))
+
+    def test_max_min(self):
+        n = 20
+        colony = AntColony(np.random.rand(n, 2) * 100, n)
+        opts = {**AntColony.defaults, 'max_min': True, 'deposit': 'iteration_best', 'Q': 1000}
+        pheromones = np.full((n, n), opts['initial_pheromones'])
+        heuristic = 1 / (colony.evaluator.distances + np.eye(n))
+
+        best = None
+        for _ in range(10):
+            trajectories = colony.construct_all(pheromones * heuristic, np.arange(n))
+            paths = [Trajectory(t, d) for t, d in zip(trajectories.tolist(), colony.evaluator.cost_many(trajectories))]
+            best = min(paths + ([best] if best else []), key=lambda path: path.distance)
+            colony.update_pheromones(pheromones, paths, opts, best)
+
+            tau_max = opts['Q'] / ((1 - opts['ro']) * best.distance)
+            self.assertTrue((pheromones >= tau_max / (2 * n) - 1e-12).all())
+            self.assertTrue((pheromones <= tau_max + 1e-12).all())
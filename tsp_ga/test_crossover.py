@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+import random
+
+from crossover import OPERATORS
+
+
+class TestCrossover(TestCase):
+    def test_permutation(self):
+        for name, crossover in OPERATORS.items():
+            for n in [2, 3, 10, 50]:
+                a = list(range(n))
+                b = list(range(n))
+                random.shuffle(a)
+                random.shuffle(b)
+
+                for _ in range(20):
+                    self.assertEqual(list(range(n)), sorted(crossover(a, b)), name)
+
+    def test_same_parents(self):
+        def edges(trajectory):
+            return {frozenset(edge) for edge in zip(trajectory, trajectory[1:] + trajectory[:1])}
+
+        a = [3, 1, 4, 0, 2]
+        for name, crossover in OPERATORS.items():
+            self.assertEqual(edges(a), edges(crossover(a, a)), name)
@@ -2,10 +2,33 @@ from unittest import TestCase
 
 
 from collections import namedtuple
-from common import Evaluator
+from common import Evaluator, swap
+import numpy as np
 
 City = namedtuple('City', ['x', 'y', 'name', 'id'])
 
+CITIES = [
+    City(10, 10, 'A', 0),
+    City(20, 10, 'B', 1),
+    City(20, 20, 'C', 2),
+    City(10, 20, 'D', 3),
+]
+
+
+def two_opt(trajectory, i, j):
+    trajectory[i + 1:j + 1] = trajectory[i + 1:j + 1][::-1]
+    return trajectory
+
+
+def or_opt(trajectory, i, length, j):
+    """
+    move segment i..i+length-1 (not wrapping around the end) of list trajectory after position j
+    """
+    segment = trajectory[i:i + length]
+    rest = trajectory[:i] + trajectory[i + length:]
+    j = j if j < i else j - length
+    return rest[:j + 1] + segment + rest[j + 1:]
+
 
 class TestEvaluator(TestCase):
     def test_cost(self):
@@ -21,3 +44,54 @@ class TestEvaluator(TestCase):
         self.assertEqual(40, evaluator.cost([0, 1, 2, 3]))
         self.assertEqual(40, evaluator.cost([3, 2, 1, 0]))
         self.assertEqual(48.2842712474619, evaluator.cost([0, 2, 3, 2]))
+
+    def test_cost_many(self):
+        evaluator = Evaluator(CITIES)
+
+        tours = np.array([[0, 1, 2, 3], [3, 2, 1, 0], [0, 2, 3, 2]])
+        np.testing.assert_allclose([40, 40, 48.2842712474619], evaluator.cost_many(tours))
+
+        with self.assertRaises(ValueError):
+            evaluator.cost_many(np.array([[0, 1, 2]]))
+
+    def test_deltas(self):
+        evaluator = Evaluator(CITIES)
+        trajectory = [0, 2, 1, 3]
+        cost = evaluator.cost(trajectory)
+
+        self.assertAlmostEqual(evaluator.cost(swap(trajectory.copy(), 1, 2)) - cost,
+                               evaluator.swap_delta(trajectory, 1, 2))
+        self.assertAlmostEqual(evaluator.cost(two_opt(trajectory.copy(), 0, 2)) - cost,
+                               evaluator.two_opt_delta(trajectory, 0, 2))
+        self.assertAlmostEqual(evaluator.cost(or_opt(trajectory.copy(), 1, 1, 2)) - cost,
+                               evaluator.or_opt_delta(trajectory, 1, 1, 2))
+
+    def test_deltas_random(self):
+        def rotate(trajectory, shift):
+            return trajectory[shift:] + trajectory[:shift]
+
+        for n in [8, 9, 15]:
+            for _ in range(5):
+                evaluator = Evaluator(np.random.rand(n, 2))
+                trajectory = np.random.permutation(n).tolist()
+                cost = evaluator.cost(trajectory)
+
+                # every position including wrap-around ones, moves are applied on rotated tour that does not wrap
+                for i in range(n):
+                    for j in range(n):
+                        self.assertAlmostEqual(evaluator.cost(swap(trajectory.copy(), i, j)) - cost,
+                                               evaluator.swap_delta(trajectory, i, j))
+
+                        if j != i:
+                            rotated = rotate(trajectory, (i + 1) % n)
+                            self.assertAlmostEqual(evaluator.cost(two_opt(rotated, -1, (j - i - 1) % n)) - cost,
+                                                   evaluator.two_opt_delta(trajectory, i, j))
+
+                    for length in range(1, 4):
+                        rotated = rotate(trajectory, i)
+                        # j right after the segment up to two positions before it
+                        for j in range(i + length, i + n - 1):
+                            for reverse in [False, True]:
+                                moved = rotated[:length][::-1] + rotated[length:] if reverse else rotated
+                                self.assertAlmostEqual(evaluator.cost(or_opt(moved, 0, length, j - i)) - cost,
+                                                       evaluator.or_opt_delta(trajectory, i, length, j % n, reverse))
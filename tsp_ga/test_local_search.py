@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+import random
+
+import numpy as np
+
+from common import Evaluator
+from local_search import LocalSearch
+
+
+class TestLocalSearch(TestCase):
+    def check(self, coords):
+        evaluator = Evaluator(coords)
+        local_search = LocalSearch(evaluator, neighbours=random.randint(1, 12), max_segment=random.randint(1, 4))
+
+        trajectory = list(range(len(coords)))
+        random.shuffle(trajectory)
+        improved, distance = local_search.improve(trajectory, evaluator.cost(trajectory))
+
+        self.assertEqual(list(range(len(coords))), sorted(improved))
+        self.assertAlmostEqual(evaluator.cost(improved), distance, delta=1e-9)
+
+    def test_random(self):
+        for n in [5, 6, 7, 10, 30, 60]:
+            for _ in range(20):
+                self.check(np.random.rand(n, 2) * 100)
+
+    def test_duplicates(self):
+        for n in [5, 6, 7, 10, 30, 60]:
+            for _ in range(20):
+                self.check(np.random.randint(0, 4, (n, 2)))
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+import numpy as np
+
+from selection import METHODS, select_parents, select_survivors
+
+
+class TestSelection(TestCase):
+    def test_parents(self):
+        costs = np.array([5.0, 1.0, 3.0, 2.0, 4.0])
+        for name, method in METHODS.items():
+            pairs = select_parents(method, costs, 100)
+
+            self.assertEqual((100, 2), pairs.shape, name)
+            self.assertTrue(((pairs >= 0) & (pairs < len(costs))).all(), name)
+            self.assertFalse((pairs[:, 0] == pairs[:, 1]).any(), name)
+
+    def test_parents_same_best(self):
+        # tournament of the whole population always picks the best, pairs still have distinct parents
+        costs = np.array([5.0, 1.0, 3.0])
+        pairs = select_parents(METHODS['tournament'], costs, 100, tournament_size=len(costs))
+        self.assertFalse((pairs[:, 0] == pairs[:, 1]).any())
+        self.assertTrue((pairs == 1).any(axis=1).all())
+
+    def test_tournament(self):
+        costs = np.array([5.0, 1.0, 3.0, 2.0, 4.0])
+        self.assertTrue((METHODS['tournament'](costs, 1000, tournament_size=len(costs)) == 1).all())
+
+    def test_proportionate(self):
+        costs = np.array([5.0, 1.0, 3.0, 2.0, 4.0])
+        for name in ['roulette', 'sus']:
+            counts = np.bincount(METHODS[name](costs, 10000), minlength=len(costs))
+            # best unit has fitness 1 and the worst almost 0
+            self.assertGreater(counts[1], 3000, name)
+            self.assertLess(counts[0], 100, name)
+
+    def test_survivors(self):
+        costs = np.array([5.0, 1.0, 3.0, 2.0, 4.0])
+
+        self.assertEqual([1, 2, 3], sorted(select_survivors(costs, 3)))
+        self.assertEqual(5, len(select_survivors(costs, 10)))
@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+import numpy as np
+
+from tsplib import parse
+
+SQUARE = """NAME : square
+TYPE : TSP
+DIMENSION : 4
+EDGE_WEIGHT_TYPE : EUC_2D
+NODE_COORD_SECTION
+1 10 10
+2 20 10
+3 20.4 20
+4 10 20
+EOF
+"""
+
+EXPLICIT = """NAME: explicit
+TYPE: TSP
+DIMENSION: 4
+EDGE_WEIGHT_TYPE: EXPLICIT
+EDGE_WEIGHT_FORMAT: {}
+EDGE_WEIGHT_SECTION
+{}
+EOF
+"""
+
+
+class TestTsplib(TestCase):
+    def test_coords(self):
+        instance = parse(SQUARE)
+
+        self.assertEqual(4, len(instance))
+        dense = instance.evaluator()
+        lazy = instance.evaluator(dense=False)
+        self.assertEqual(14, dense.distances[0, 2])
+        self.assertEqual(40, dense.cost([0, 1, 2, 3]))
+        self.assertEqual(40, lazy.cost([0, 1, 2, 3]))
+        np.testing.assert_array_equal(dense.nearest(2), lazy.nearest(2))
+
+    def test_explicit(self):
+        expected = np.array([
+            [0, 1, 2, 3],
+            [1, 0, 4, 5],
+            [2, 4, 0, 6],
+            [3, 5, 6, 0],
+        ])
+        formats = {
+            'FULL_MATRIX': '0 1 2 3 1 0 4 5 2 4 0 6 3 5 6 0',
+            'UPPER_ROW': '1 2 3\n4 5\n6',
+            'LOWER_DIAG_ROW': '0\n1 0\n2 4 0\n3 5 6 0',
+            'UPPER_COL': '1\n2 4\n3 5 6',
+        }
+        for edge_weight_format, values in formats.items():
+            instance = parse(EXPLICIT.format(edge_weight_format, values))
+            np.testing.assert_array_equal(expected, instance.matrix, edge_weight_format)
@@ -0,0 +1,107 @@
+"""
+Loader of TSPLIB .tsp instances (EUC_2D, CEIL_2D, GEO and EXPLICIT edge weights).
+Coordinates are parsed directly into numpy arrays.
+"""
+import re
+
+import numpy as np
+
+from common import Evaluator
+
+# largest instance for which dense distance matrix is built by default
+DENSE_LIMIT = 5000
+
+HEADER = re.compile(r'^([A-Z_]+)\s*:(.*)$')
+
+
+class Instance:
+    def __init__(self, name, edge_weight_type, coords=None, matrix=None, comment=''):
+        self.name = name
+        self.edge_weight_type = edge_weight_type
+        self.coords = coords
+        self.matrix = matrix
+        self.comment = comment
+
+    def __len__(self):
+        return len(self.matrix) if self.coords is None else len(self.coords)
+
+    def evaluator(self, dense=None, dtype=np.float64):
+        """
+        Evaluator of the instance, big instances compute distances on the fly instead of dense matrix
+        """
+        if self.matrix is not None:
+            return Evaluator(distances=self.matrix, dtype=dtype)
+
+        if dense is None:
+            dense = len(self) <= DENSE_LIMIT
+        return Evaluator(self.coords, metric=self.edge_weight_type, dense=dense, dtype=dtype)
+
+
+def explicit_matrix(values, dimension, edge_weight_format):
+    if edge_weight_format == 'FULL_MATRIX':
+        return values[:dimension * dimension].reshape(dimension, dimension)
+
+    diagonal = edge_weight_format.endswith('DIAG_ROW') or edge_weight_format.endswith('DIAG_COL')
+    if edge_weight_format.startswith('UPPER'):
+        rows, cols = np.triu_indices(dimension, k=0 if diagonal else 1)
+    elif edge_weight_format.startswith('LOWER'):
+        rows, cols = np.tril_indices(dimension, k=0 if diagonal else -1)
+    else:
+        raise NotImplementedError(f"Unsupported EDGE_WEIGHT_FORMAT {edge_weight_format}")
+
+    # column-wise formats are transposed row-wise ones
+    if edge_weight_format.endswith('COL'):
+        rows, cols = cols, rows
+        order = np.lexsort((cols, rows))
+        rows, cols = rows[order], cols[order]
+
+    matrix = np.zeros((dimension, dimension))
+    matrix[rows, cols] = values[:len(rows)]
+    matrix[cols, rows] = values[:len(rows)]
+    return matrix
+
+
+def parse(text):
+    header = {}
+    sections = {}
+    section = None
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line == 'EOF':
+            break
+        if not line:
+            continue
+
+        header_line = HEADER.match(line)
+        if line.rstrip(' :').endswith('_SECTION'):
+            section = line.rstrip(' :')
+            sections[section] = []
+        elif header_line:
+            header[header_line.group(1)] = header_line.group(2).strip()
+            section = None
+        elif section:
+            sections[section].append(line)
+
+    dimension = int(header['DIMENSION'])
+    edge_weight_type = header.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+    name = header.get('NAME', '')
+    comment = header.get('COMMENT', '')
+
+    if edge_weight_type == 'EXPLICIT':
+        values = np.array(' '.join(sections['EDGE_WEIGHT_SECTION']).split(), dtype=np.float64)
+        matrix = explicit_matrix(values, dimension, header.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX'))
+        return Instance(name, edge_weight_type, matrix=matrix, comment=comment)
+
+    if edge_weight_type not in ('EUC_2D', 'CEIL_2D', 'GEO'):
+        raise NotImplementedError(f"Unsupported EDGE_WEIGHT_TYPE {edge_weight_type}")
+
+    nodes = np.array(' '.join(sections['NODE_COORD_SECTION']).split(), dtype=np.float64).reshape(-1, 3)
+    coords = np.empty((dimension, 2))
+    coords[nodes[:, 0].astype(int) - 1] = nodes[:, 1:]
+    return Instance(name, edge_weight_type, coords=coords, comment=comment)
+
+
+def load(path):
+    with open(path) as f:
+        return parse(f.read())